@@ -12,7 +12,7 @@ from typing import List, Dict, Any
 
 # Add src to path
 sys.path.append('src')
-from src.order_schema import MenuItemTemplate, SizeType, ModificationType
+from src.order_schema import MenuItemTemplate, SizeType, ModificationType, OrderSchema, MENU_CATALOG_PATH
 
 class MenuDatabaseIntegrator:
     def __init__(self, extracted_data_file: str):
@@ -165,116 +165,17 @@ class MenuDatabaseIntegrator:
         print(f"🎉 Successfully integrated {len(integrated_menu)} menu items from {len(extracted_data)} chains!")
         return integrated_menu
     
-    def create_enhanced_baseline_parser(self, menu_items: List[MenuItemTemplate]) -> str:
-        """Create enhanced baseline parser code with new menu items"""
-        
-        # Generate the menu items code
-        menu_items_code = "        return [\n"
-        
-        for item in menu_items:
-            # Convert item to code representation
-            size_names = []
-            for size in item.available_sizes:
-                if hasattr(size, 'name'):
-                    size_names.append(f'SizeType.{size.name}')
-                else:
-                    size_name = str(size).upper().replace(' ', '_')
-                    size_names.append(f'SizeType.{size_name}')
-            sizes_code = f"[{', '.join(size_names)}]"
-            
-            size_pricing_code = "{\n"
-            for size, price in item.size_pricing.items():
-                size_pricing_code += f'                "{size}": Decimal("{price}"),\n'
-            size_pricing_code += "            }"
-            
-            modifications_code = f"[{', '.join([repr(mod) for mod in item.available_modifications])}]"
-            
-            mod_pricing_code = "{\n"
-            for mod, price in item.modification_pricing.items():
-                mod_pricing_code += f'                "{mod}": Decimal("{price}"),\n'
-            mod_pricing_code += "            }"
-            
-            keywords_code = f"[{', '.join([repr(kw) for kw in item.keywords])}]"
-            
-            menu_items_code += f'''            MenuItemTemplate(
-                name="{item.name}",
-                category="{item.category}",
-                base_price=Decimal("{item.base_price}"),
-                available_sizes={sizes_code},
-                size_pricing={size_pricing_code},
-                available_modifications={modifications_code},
-                modification_pricing={mod_pricing_code},
-                keywords={keywords_code}
-            ),\n'''
-        
-        menu_items_code += "        ]"
-        
-        return menu_items_code
-    
     def update_baseline_parser(self, menu_items: List[MenuItemTemplate]):
-        """Update the order schema with new menu items"""
-        print("🔧 Updating order schema with new menu database...")
-        
-        parser_file = "src/order_schema.py"
+        """Update the menu catalog the order schema loads with new menu items"""
+        print("🔧 Updating menu catalog with new menu database...")
         
         try:
-            # Read the current file
-            with open(parser_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find the menu items section and replace it
-            start_marker = "        return ["
-            end_marker = "        ]"
-            
-            start_idx = content.find(start_marker)
-            if start_idx == -1:
-                print("❌ Could not find menu items section in baseline parser")
-                return False
-            
-            # Find the end of the menu items list
-            bracket_count = 0
-            end_idx = start_idx + len(start_marker)
-            in_string = False
-            escape_next = False
-            
-            for i in range(start_idx + len(start_marker), len(content)):
-                char = content[i]
-                
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                
-                if not in_string:
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        if bracket_count == 0:
-                            end_idx = i + 1
-                            break
-                        bracket_count -= 1
-            
-            # Generate new menu items code
-            new_menu_code = self.create_enhanced_baseline_parser(menu_items)
-            
-            # Replace the old menu items with new ones
-            new_content = content[:start_idx] + new_menu_code + content[end_idx:]
-            
-            # Write the updated file
-            with open(parser_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            print(f"✅ Successfully updated {parser_file} with {len(menu_items)} menu items!")
+            OrderSchema.save_menu_catalog(menu_items)
+            print(f"✅ Successfully updated {MENU_CATALOG_PATH} with {len(menu_items)} menu items!")
             return True
             
         except Exception as e:
-            print(f"❌ Error updating baseline parser: {e}")
+            print(f"❌ Error updating menu catalog: {e}")
             return False
     
     def save_menu_summary(self, menu_items: List[MenuItemTemplate]):
@@ -342,7 +243,7 @@ def main():
         print("🎉 INTEGRATION COMPLETE!")
         print("=" * 50)
         print(f"✅ Integrated {len(menu_items)} menu items")
-        print("✅ Updated baseline order parser")
+        print("✅ Updated menu catalog")
         print("✅ Enhanced with sizes, modifications, and keywords")
         print("✅ Ready for text-to-order processing!")
         print("\n🚀 Your Food Sense app now supports 20 major restaurant chains!")
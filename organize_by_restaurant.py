@@ -13,7 +13,7 @@ from collections import defaultdict
 
 # Add src to path
 sys.path.append('src')
-from src.order_schema import MenuItemTemplate, SizeType, ModificationType
+from src.order_schema import MenuItemTemplate, SizeType, ModificationType, OrderSchema, MENU_CATALOG_PATH
 
 class RestaurantBrandOrganizer:
     def __init__(self):
@@ -65,11 +65,10 @@ class RestaurantBrandOrganizer:
             return "General"  # Fallback category
     
     def load_current_menu(self) -> List[MenuItemTemplate]:
-        """Load current menu items from order_schema.py"""
-        print("📂 Loading current menu items from order_schema.py...")
+        """Load current menu items from the menu catalog"""
+        print("📂 Loading current menu items from the menu catalog...")
         
         try:
-            from src.order_schema import OrderSchema
             menu_items = OrderSchema.create_sample_menu()
             print(f"✅ Loaded {len(menu_items)} menu items")
             return menu_items
@@ -97,123 +96,19 @@ class RestaurantBrandOrganizer:
         
         return sorted_restaurants
     
-    def create_restaurant_menu_code(self, restaurant_groups: Dict[str, List[MenuItemTemplate]]) -> str:
-        """Create the menu code organized by restaurant"""
-        print("🔧 Generating restaurant-organized menu code...")
-        
-        menu_code = "        return [\n"
-        
-        for restaurant, items in restaurant_groups.items():
-            menu_code += f"            # {restaurant} Menu Items\n"
-            
-            for item in items:
-                # Convert sizes
-                size_names = []
-                for size in item.available_sizes:
-                    if hasattr(size, 'name'):
-                        size_names.append(f'SizeType.{size.name}')
-                    else:
-                        size_name = str(size).upper().replace(' ', '_')
-                        size_names.append(f'SizeType.{size_name}')
-                sizes_code = f"[{', '.join(size_names)}]"
-                
-                # Convert size pricing
-                size_pricing_code = "{\n"
-                for size, price in item.size_pricing.items():
-                    size_pricing_code += f'                "{size}": Decimal("{price}"),\n'
-                size_pricing_code += "            }"
-                
-                # Convert modifications
-                modifications_code = f"[{', '.join([repr(mod) for mod in item.available_modifications])}]"
-                
-                # Convert modification pricing
-                mod_pricing_code = "{\n"
-                for mod, price in item.modification_pricing.items():
-                    mod_pricing_code += f'                "{mod}": Decimal("{price}"),\n'
-                mod_pricing_code += "            }"
-                
-                # Convert keywords
-                keywords_code = f"[{', '.join([repr(kw) for kw in item.keywords])}]"
-                
-                menu_code += f'''            MenuItemTemplate(
-                name="{item.name}",
-                category="{item.category}",
-                base_price=Decimal("{item.base_price}"),
-                available_sizes={sizes_code},
-                size_pricing={size_pricing_code},
-                available_modifications={modifications_code},
-                modification_pricing={mod_pricing_code},
-                keywords={keywords_code}
-            ),\n'''
-            
-            menu_code += "\n"  # Add spacing between restaurants
-        
-        menu_code += "        ]"
-        return menu_code
-    
     def update_order_schema(self, restaurant_groups: Dict[str, List[MenuItemTemplate]]):
-        """Update order_schema.py with restaurant-organized menu"""
-        print("📝 Updating order_schema.py with restaurant-organized menu...")
-        
-        schema_file = "src/order_schema.py"
+        """Rewrite the menu catalog the order schema loads, grouped by restaurant"""
+        print("📝 Updating menu catalog with restaurant-organized menu...")
         
         try:
-            # Read current file
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Find the create_sample_menu method
-            start_marker = "        return ["
-            start_idx = content.find(start_marker)
-            
-            if start_idx == -1:
-                print("❌ Could not find menu items section")
-                return False
-            
-            # Find the end of the method
-            bracket_count = 0
-            end_idx = start_idx + len(start_marker)
-            in_string = False
-            escape_next = False
-            
-            for i in range(start_idx + len(start_marker), len(content)):
-                char = content[i]
-                
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                
-                if not in_string:
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        if bracket_count == 0:
-                            end_idx = i + 1
-                            break
-                        bracket_count -= 1
-            
-            # Generate new menu code
-            new_menu_code = self.create_restaurant_menu_code(restaurant_groups)
-            
-            # Replace the old menu with new restaurant-organized menu
-            new_content = content[:start_idx] + new_menu_code + content[end_idx:]
-            
-            # Write updated file
-            with open(schema_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            print(f"✅ Successfully updated {schema_file} with restaurant-organized menu!")
+            # The menu lives in the JSON catalog, not in order_schema.py source
+            menu_items = [item for items in restaurant_groups.values() for item in items]
+            OrderSchema.save_menu_catalog(menu_items)
+            print(f"✅ Successfully updated {MENU_CATALOG_PATH} with restaurant-organized menu!")
             return True
             
         except Exception as e:
-            print(f"❌ Error updating schema file: {e}")
+            print(f"❌ Error updating menu catalog: {e}")
             return False
     
     def save_restaurant_summary(self, restaurant_groups: Dict[str, List[MenuItemTemplate]]):
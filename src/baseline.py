@@ -1,11 +1,12 @@
 import re
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Any, Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
 from src.schema import MenuItem, MenuSchema
+from src.text_patterns import trie_pattern
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryRule:
     """Rule for categorizing menu items"""
     keywords: Set[str]
@@ -13,7 +14,7 @@ class CategoryRule:
     priority: int = 1  # Higher priority rules are checked first
 
 
-@dataclass
+@dataclass(slots=True)
 class CuisineRule:
     """Rule for determining cuisine type"""
     keywords: Set[str]
@@ -21,7 +22,7 @@ class CuisineRule:
     priority: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRule:
     """Rule for determining attributes"""
     keywords: Set[str]
@@ -29,6 +30,67 @@ class AttributeRule:
     priority: int = 1
 
 
+class _RuleMatcher:
+    """Finds every rule with a keyword in a text in one regex pass.
+
+    All keywords of a rule list are compiled into one trie-shaped pattern
+    that reports the longest keyword at each position; the shorter keywords
+    starting there are exactly its keyword prefixes, so every substring hit
+    of the per-keyword scan is still found. Rules are held sorted by
+    priority (highest first) and each keyword maps to a bitmask of the rules
+    listing it, so the first matching rule is the lowest set bit. An empty
+    keyword stays out of the pattern and, like ``'' in text``, is always found.
+    """
+    
+    def __init__(self, rules: List[Any]):
+        self.rules = sorted(rules, key=lambda x: x.priority, reverse=True)
+        masks: Dict[str, int] = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in rule.keywords:
+                masks[keyword] = masks.get(keyword, 0) | 1 << index
+        self._masks = masks
+        self._prefixes = {
+            keyword: [keyword] + [keyword[:end] for end in range(1, len(keyword)) if keyword[:end] in masks]
+            for keyword in masks
+        }
+        words = [keyword for keyword in masks if keyword]
+        self._pattern = re.compile(trie_pattern(words)) if words else None
+    
+    def keywords(self, text: str) -> Set[str]:
+        """Distinct keywords occurring anywhere in text"""
+        found: Set[str] = {''} if '' in self._masks else set()
+        if self._pattern is None:
+            return found
+        pos = 0
+        while pos <= len(text) and (match := self._pattern.search(text, pos)) is not None:
+            found.update(self._prefixes[match.group()])
+            pos = match.start() + 1
+        return found
+    
+    def matching(self, text: str) -> List[Any]:
+        """Rules with at least one keyword in text, in priority order"""
+        mask = 0
+        for keyword in self.keywords(text):
+            mask |= self._masks[keyword]
+        rules = []
+        while mask:
+            low = mask & -mask
+            rules.append(self.rules[low.bit_length() - 1])
+            mask ^= low
+        return rules
+    
+    def first(self, text: str) -> Optional[Any]:
+        """Highest-priority rule with a keyword in text, or None"""
+        mask = 0
+        for keyword in self.keywords(text):
+            mask |= self._masks[keyword]
+        return self.rules[(mask & -mask).bit_length() - 1] if mask else None
+    
+    def count(self, text: str) -> int:
+        """Number of (rule, keyword) pairs whose keyword occurs in text"""
+        return sum(self._masks[keyword].bit_count() for keyword in self.keywords(text))
+
+
 class BaselineClassifier:
     """Rule-based baseline classifier for menu items"""
     
@@ -36,6 +98,11 @@ class BaselineClassifier:
         self.category_rules = self._create_category_rules()
         self.cuisine_rules = self._create_cuisine_rules()
         self.attribute_rules = self._create_attribute_rules()
+        
+        # Rules are sorted and compiled once, not on every classification
+        self._category_matcher = _RuleMatcher(self.category_rules)
+        self._cuisine_matcher = _RuleMatcher(self.cuisine_rules)
+        self._attribute_matcher = _RuleMatcher(self.attribute_rules)
     
     def _create_category_rules(self) -> List[CategoryRule]:
         """Create category classification rules"""
@@ -168,13 +235,10 @@ class BaselineClassifier:
         """Classify menu item category using rules"""
         processed_text = self.preprocess_text(item_name)
         
-        # Sort rules by priority (highest first)
-        sorted_rules = sorted(self.category_rules, key=lambda x: x.priority, reverse=True)
-        
-        for rule in sorted_rules:
-            for keyword in rule.keywords:
-                if keyword in processed_text:
-                    return rule.category
+        # Highest-priority rule with a keyword in the text
+        rule = self._category_matcher.first(processed_text)
+        if rule is not None:
+            return rule.category
         
         # Default category if no rules match
         return "Main Dish"
@@ -183,13 +247,10 @@ class BaselineClassifier:
         """Classify menu item cuisine using rules"""
         processed_text = self.preprocess_text(item_name)
         
-        # Sort rules by priority (highest first)
-        sorted_rules = sorted(self.cuisine_rules, key=lambda x: x.priority, reverse=True)
-        
-        for rule in sorted_rules:
-            for keyword in rule.keywords:
-                if keyword in processed_text:
-                    return rule.cuisine
+        # Highest-priority rule with a keyword in the text
+        rule = self._cuisine_matcher.first(processed_text)
+        if rule is not None:
+            return rule.cuisine
         
         # Default cuisine if no rules match
         return "American"
@@ -199,13 +260,10 @@ class BaselineClassifier:
         processed_text = self.preprocess_text(item_name)
         attributes = []
         
-        # Sort rules by priority (highest first)
-        sorted_rules = sorted(self.attribute_rules, key=lambda x: x.priority, reverse=True)
-        
-        for rule in sorted_rules:
-            for keyword in rule.keywords:
-                if keyword in processed_text and rule.attribute not in attributes:
-                    attributes.append(rule.attribute)
+        # Matching rules in priority order (highest first)
+        for rule in self._attribute_matcher.matching(processed_text):
+            if rule.attribute not in attributes:
+                attributes.append(rule.attribute)
         
         return attributes
     
@@ -263,17 +321,9 @@ class BaselineClassifier:
         }
         
         # Count matching keywords for each type
-        category_matches = sum(1 for rule in self.category_rules 
-                             for keyword in rule.keywords 
-                             if keyword in processed_text)
-        
-        cuisine_matches = sum(1 for rule in self.cuisine_rules 
-                            for keyword in rule.keywords 
-                            if keyword in processed_text)
-        
-        attribute_matches = sum(1 for rule in self.attribute_rules 
-                              for keyword in rule.keywords 
-                              if keyword in processed_text)
+        category_matches = self._category_matcher.count(processed_text)
+        cuisine_matches = self._cuisine_matcher.count(processed_text)
+        attribute_matches = self._attribute_matcher.count(processed_text)
         
         # Simple confidence based on number of matches
         confidence["category"] = min(category_matches / 3.0, 1.0)
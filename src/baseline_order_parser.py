@@ -9,8 +9,13 @@ from decimal import Decimal
 import logging
 from src.order_schema import (
     Order, OrderItem, Modification, MenuItemTemplate, OrderSchema,
-    SizeType, ModificationType
+    SizeType, ModificationType, _is_sample_menu
 )
+from src.menu_index import KeywordMatcher, keyword_matcher_for, keyword_scanner_for
+
+# Restaurant keyword table -> (name index, restaurant buckets) of the sample menu,
+# which every parser over TEMPLATES would otherwise rebuild item by item
+_SAMPLE_MENU_INDEXES: Dict[Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[Dict[str, MenuItemTemplate], Dict[str, List[MenuItemTemplate]]]] = {}
 
 
 class BaselineOrderParser:
@@ -110,31 +115,70 @@ class BaselineOrderParser:
     
     def _build_indexes(self):
         """Build keyword indexes for menu items"""
-        self.name_to_item = {}
-        self.keyword_to_item = {}
-        self.restaurant_to_items = {}
-        
+        self.keyword_matcher = keyword_matcher_for(self.menu_items)
+        # Shared with every parser over the same menu, so read-only
+        self.keyword_to_item = self.keyword_matcher.keyword_items()
+        self._keyword_matchers = {}
+        
+        # Every restaurant keyword in one compiled scanner; each keyword id maps
+        # to the (restaurant index, list position) slots that list it
+        self._restaurant_names = list(self.restaurant_keywords)
+        self._restaurant_scanner = keyword_scanner_for(
+            [keyword for keywords in self.restaurant_keywords.values() for keyword in keywords])
+        self._restaurant_slots = [[] for _ in self._restaurant_scanner.keywords]
+        for index, keywords in enumerate(self.restaurant_keywords.values()):
+            for position, keyword in enumerate(keywords):
+                keyword_id = self._restaurant_scanner.keyword_id(keyword)
+                self._restaurant_slots[keyword_id].append((index, position, keyword_id))
+        
+        # The sample menu's indexes depend only on the restaurant table, so they
+        # are built once per process; each parser gets its own copies
+        if _is_sample_menu(self.menu_items):
+            key = tuple((restaurant, tuple(keywords)) for restaurant, keywords in self.restaurant_keywords.items())
+            indexes = _SAMPLE_MENU_INDEXES.get(key)
+            if indexes is None:
+                indexes = _SAMPLE_MENU_INDEXES[key] = self._index_items()
+            name_to_item, restaurant_to_items = indexes
+            self.name_to_item = dict(name_to_item)
+            self.restaurant_to_items = {restaurant: list(items) for restaurant, items in restaurant_to_items.items()}
+        else:
+            self.name_to_item, self.restaurant_to_items = self._index_items()
+    
+    def _index_items(self) -> Tuple[Dict[str, MenuItemTemplate], Dict[str, List[MenuItemTemplate]]]:
+        """Index menu items by lowercased name and by restaurant"""
+        name_to_item = {}
+        restaurant_to_items = {}
         for item in self.menu_items:
             # Index by exact name
-            self.name_to_item[item.name.lower()] = item
-            
-            # Index by keywords
-            for keyword in item.keywords:
-                self.keyword_to_item[keyword.lower()] = item
+            name_to_item[item.name.lower()] = item
             
             # Index by restaurant
             restaurant = self._identify_item_restaurant(item)
-            if restaurant not in self.restaurant_to_items:
-                self.restaurant_to_items[restaurant] = []
-            self.restaurant_to_items[restaurant].append(item)
+            if restaurant not in restaurant_to_items:
+                restaurant_to_items[restaurant] = []
+            restaurant_to_items[restaurant].append(item)
+        return name_to_item, restaurant_to_items
+    
+    def _get_keyword_matcher(self, items: List[MenuItemTemplate]) -> KeywordMatcher:
+        """Get a compiled keyword matcher for a list of menu items, building it once"""
+        if items is self.menu_items:
+            return self.keyword_matcher
+        
+        key = tuple(map(id, items))
+        matcher = self._keyword_matchers.get(key)
+        if matcher is None:
+            matcher = self._keyword_matchers[key] = KeywordMatcher(items)
+        return matcher
     
     def _identify_item_restaurant(self, item: MenuItemTemplate) -> str:
         """Identify which restaurant an item belongs to"""
         name_lower = item.name.lower()
         
-        for restaurant, keywords in self.restaurant_keywords.items():
-            if any(keyword in name_lower for keyword in keywords):
-                return restaurant
+        # First restaurant (in table order) listing any keyword found in the name
+        indexes = [index for keyword_id in self._restaurant_scanner.find(name_lower)
+                   for index, _, _ in self._restaurant_slots[keyword_id]]
+        if indexes:
+            return self._restaurant_names[min(indexes)]
         
         return "General"
     
@@ -143,20 +187,19 @@ class BaselineOrderParser:
         text_lower = text.lower()
         restaurant_scores = {}
         
-        # Check for explicit restaurant mentions
-        for restaurant, keywords in self.restaurant_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    # Longer keywords get higher scores
-                    keyword_score = len(keyword) / 10.0
-                    # Exact word boundaries get bonus
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                        keyword_score *= 1.5
-                    score += keyword_score
-            
-            if score > 0:
-                restaurant_scores[restaurant] = score
+        # One scan finds every keyword present; slots are visited in restaurant
+        # and keyword-list order, so scores add up as in a per-restaurant loop
+        slots = sorted(slot for keyword_id in self._restaurant_scanner.find(text_lower)
+                       for slot in self._restaurant_slots[keyword_id])
+        for index, _, keyword_id in slots:
+            keyword = self._restaurant_scanner.keywords[keyword_id]
+            # Longer keywords get higher scores
+            keyword_score = len(keyword) / 10.0
+            # Exact word boundaries get bonus
+            if self._restaurant_scanner.occurs_as_word(keyword_id, text_lower):
+                keyword_score *= 1.5
+            restaurant = self._restaurant_names[index]
+            restaurant_scores[restaurant] = restaurant_scores.get(restaurant, 0) + keyword_score
         
         if not restaurant_scores:
             return None, 0.0
@@ -236,12 +279,11 @@ class BaselineOrderParser:
                 best_match = None
                 best_score = 0
                 
-                for keyword, item in self.keyword_to_item.items():
-                    if keyword in search_text:
-                        score = len(keyword)  # Longer keywords get higher priority
-                        if score > best_score:
-                            best_match = keyword
-                            best_score = score
+                for keyword in self.keyword_matcher.find_keywords(search_text):
+                    score = len(keyword)  # Longer keywords get higher priority
+                    if score > best_score:
+                        best_match = keyword
+                        best_score = score
                 
                 if best_match:
                     quantities[best_match] = qty
@@ -260,8 +302,8 @@ class BaselineOrderParser:
                 context_pos = text.find(context_word)
                 before_after = text[max(0, context_pos-20):context_pos+50]
                 
-                for keyword, item in self.keyword_to_item.items():
-                    if keyword in before_after and keyword not in quantities:
+                for keyword in self.keyword_matcher.find_keywords(before_after):
+                    if keyword not in quantities:
                         quantities[keyword] = qty
                         break
         
@@ -287,17 +329,12 @@ class BaselineOrderParser:
         
         # Find size keywords and their nearby menu items
         for i, word in enumerate(words):
-            size_found = None
-            
             # Check for exact size matches
-            if word in size_patterns:
-                size_found = size_patterns[word]
+            size_found = size_patterns.get(word)
             
             # Check for multi-word sizes (like "extra large")
             if i + 1 < len(words):
-                two_word = f"{word} {words[i+1]}"
-                if two_word in size_patterns:
-                    size_found = size_patterns[two_word]
+                size_found = size_patterns.get(f"{word} {words[i+1]}", size_found)
             
             if size_found:
                 # Look for menu items nearby (prioritize items after the size word)
@@ -313,15 +350,15 @@ class BaselineOrderParser:
                     best_match = None
                     best_score = 0
                     
-                    for keyword, item in self.keyword_to_item.items():
-                        if keyword in search_text:
-                            # Check if this item actually supports this size
-                            if hasattr(item, 'available_sizes') and item.available_sizes:
-                                if size_found in item.available_sizes:
-                                    score = len(keyword)  # Longer matches are better
-                                    if score > best_score:
-                                        best_match = keyword
-                                        best_score = score
+                    for keyword_id in self.keyword_matcher.find(search_text):
+                        keyword = self.keyword_matcher.keywords[keyword_id]
+                        item = self.keyword_matcher.item_for(keyword_id)
+                        # Check if this item actually supports this size
+                        if item.supports_size(size_found):
+                            score = len(keyword)  # Longer matches are better
+                            if score > best_score:
+                                best_match = keyword
+                                best_score = score
                     
                     if best_match:
                         sizes[best_match] = size_found
@@ -458,7 +495,7 @@ class BaselineOrderParser:
         
         if mod_item and len(mod_item) > 1:
             # Check if already exists to avoid duplicates
-            existing_items = [mod.item.lower() for mod in modifications.get('all', [])]
+            existing_items = [mod.item.lower() for mod in modifications.get('all', ())]
             if mod_item.lower() not in existing_items:
                 # Handle both enum and string values for modification type
                 mod_type_str = mod_type.value if hasattr(mod_type, 'value') else str(mod_type)
@@ -483,7 +520,7 @@ class BaselineOrderParser:
         ]
         
         for condiment in common_condiments:
-            if condiment in text and not any(condiment in mod.item for mod in modifications.get('all', [])):
+            if condiment in text and not any(condiment in mod.item for mod in modifications.get('all', ())):
                 # Only add if not already captured
                 mod = Modification(
                     type=ModificationType.ADD,
@@ -501,26 +538,25 @@ class BaselineOrderParser:
         search_items = restaurant_items if restaurant_items is not None else self.menu_items
         found_items = []
         
-        # Build temporary keyword index for search items
-        search_keywords = {}
-        for item in search_items:
-            for keyword in item.keywords:
-                search_keywords[keyword.lower()] = item
+        # Scan the text once for every keyword of the search items
+        matcher = self._get_keyword_matcher(search_items)
+        matched_keywords = [
+            (keyword_id, matcher.keywords[keyword_id], matcher.item_for(keyword_id))
+            for keyword_id in matcher.find(text)
+        ]
         
         # First pass: Look for exact multi-word matches (highest priority)
-        for keyword, item in search_keywords.items():
+        for _, keyword, item in matched_keywords:
             if len(keyword.split()) > 1:  # Multi-word keywords
-                if keyword in text:
-                    confidence = 0.95  # High confidence for exact multi-word matches
-                    if not any(existing_item == item for existing_item, _ in found_items):
-                        found_items.append((item, confidence))
+                confidence = 0.95  # High confidence for exact multi-word matches
+                if not any(existing_item == item for existing_item, _ in found_items):
+                    found_items.append((item, confidence))
         
         # Second pass: Look for exact single-word matches
-        for keyword, item in search_keywords.items():
+        for keyword_id, keyword, item in matched_keywords:
             if len(keyword.split()) == 1:  # Single word keywords
                 # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, text):
+                if matcher.occurs_as_word(keyword_id, text):
                     # Check if this is a new item (not already found with multi-word match)
                     if not any(existing_item == item for existing_item, _ in found_items):
                         confidence = 0.9  # High confidence for exact single-word matches
@@ -528,18 +564,12 @@ class BaselineOrderParser:
         
         # Third pass: Look for partial matches only if we haven't found items and no restaurant filter
         if len(found_items) == 0 and restaurant_items is None:
-            words = text.split()
-            for keyword, item in search_keywords.items():
+            # Simple fuzzy matching - keywords and words sharing a significant portion
+            for keyword_id in matcher.partial_matches(text.split()):
+                item = matcher.item_for(keyword_id)
                 if not any(existing_item == item for existing_item, _ in found_items):
-                    # Check for partial matches in individual words
-                    for word in words:
-                        if len(word) >= 4 and len(keyword) >= 4:
-                            # Simple fuzzy matching - check if words share significant portion
-                            if (word in keyword and len(word) >= len(keyword) * 0.6) or \
-                               (keyword in word and len(keyword) >= len(word) * 0.6):
-                                confidence = 0.6  # Lower confidence for fuzzy matches
-                                found_items.append((item, confidence))
-                                break
+                    confidence = 0.6  # Lower confidence for fuzzy matches
+                    found_items.append((item, confidence))
         
         # Remove duplicates and sort by confidence
         unique_items = {}
@@ -587,37 +617,34 @@ class BaselineOrderParser:
             # Get quantity (default to 1)
             quantity = 1
             for keyword in menu_item.keywords:
-                if keyword in quantities:
-                    quantity = quantities[keyword]
+                if (found := quantities.get(keyword)) is not None:
+                    quantity = found
                     break
             
             # Get size
             size = None
             for keyword in menu_item.keywords:
-                if keyword in sizes:
-                    size = sizes[keyword]
+                if (found := sizes.get(keyword)) is not None:
+                    size = found
                     break
             
             # Calculate base price with size adjustment
             base_price = menu_item.base_price
-            if size and hasattr(menu_item, 'size_pricing'):
+            if size:
                 # Handle both enum and string values for size
                 size_key = size.value if hasattr(size, 'value') else str(size)
-                size_adjustment = menu_item.size_pricing.get(size_key, Decimal('0.00'))
-                base_price += size_adjustment
+                base_price = menu_item.price(size_key)  # summed in integer cents
             
             # Get modifications
-            item_modifications = modifications.get('all', [])
+            item_modifications = modifications.get('all', ())
             
             # Filter modifications to only include those available for this item
             valid_modifications = []
             for mod in item_modifications:
-                if mod.item.lower() in [m.lower() for m in menu_item.available_modifications]:
+                price_change = menu_item.modification_price(mod.item)
+                if price_change is not None:
                     # Add pricing if available
-                    if hasattr(menu_item, 'modification_pricing'):
-                        mod.price_change = menu_item.modification_pricing.get(
-                            mod.item.lower(), Decimal('0.00')
-                        )
+                    mod.price_change = price_change
                     valid_modifications.append(mod)
             
             # Create order item
@@ -5,14 +5,49 @@ Uses large language models to parse natural language orders with high accuracy
 
 import json
 import logging
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Sequence, Union
 from decimal import Decimal
 from src.order_schema import (
     Order, OrderItem, Modification, MenuItemTemplate, OrderSchema,
-    SizeType, ModificationType
+    SizeType, ModificationType, _is_sample_menu
 )
 from src.llm_enricher import LLMConfig, OllamaClient
 
+# Fallback for prices the model returns in an unreadable form
+_NO_CHARGE = Decimal('0.00')
+
+# Rendered menu context for the sample menu, shared by every parser instance
+_SAMPLE_MENU_CONTEXT: Optional[str] = None
+
+
+def _render_menu_context(menu_items: Sequence[MenuItemTemplate]) -> str:
+    """Menu listing given to the LLM: one line per item with sizes, modifications and keywords"""
+    menu_lines = []
+    menu_lines.append("AVAILABLE MENU ITEMS:")
+    
+    for item in menu_items:
+        line = f"• {item.name} - ${item.base_price}"
+        
+        if item.available_sizes:
+            # Handle both enum values and string values
+            sizes_str = ", ".join([
+                s.value if hasattr(s, 'value') else str(s) 
+                for s in item.available_sizes
+            ])
+            line += f" (Sizes: {sizes_str})"
+        
+        if item.available_modifications:
+            mods_str = ", ".join(item.available_modifications)
+            line += f" (Modifications: {mods_str})"
+        
+        if item.keywords:
+            keywords_str = ", ".join(item.keywords)
+            line += f" (Also called: {keywords_str})"
+        
+        menu_lines.append(line)
+    
+    return "\n".join(menu_lines)
+
 
 class LLMOrderParser:
     """LLM-based parser for converting text to orders"""
@@ -28,32 +63,14 @@ class LLMOrderParser:
         self._create_menu_context()
     
     def _create_menu_context(self):
-        """Create menu context string for LLM prompts"""
-        menu_lines = []
-        menu_lines.append("AVAILABLE MENU ITEMS:")
-        
-        for item in self.menu_items:
-            line = f"• {item.name} - ${item.base_price}"
-            
-            if item.available_sizes:
-                # Handle both enum values and string values
-                sizes_str = ", ".join([
-                    s.value if hasattr(s, 'value') else str(s) 
-                    for s in item.available_sizes
-                ])
-                line += f" (Sizes: {sizes_str})"
-            
-            if item.available_modifications:
-                mods_str = ", ".join(item.available_modifications)
-                line += f" (Modifications: {mods_str})"
-            
-            if item.keywords:
-                keywords_str = ", ".join(item.keywords)
-                line += f" (Also called: {keywords_str})"
-            
-            menu_lines.append(line)
-        
-        self.menu_context = "\n".join(menu_lines)
+        """Create menu context string for LLM prompts, rendered once for the sample menu"""
+        global _SAMPLE_MENU_CONTEXT
+        if not _is_sample_menu(self.menu_items):
+            self.menu_context = _render_menu_context(self.menu_items)
+            return
+        if _SAMPLE_MENU_CONTEXT is None:
+            _SAMPLE_MENU_CONTEXT = _render_menu_context(self.menu_items)
+        self.menu_context = _SAMPLE_MENU_CONTEXT
     
     def create_order_prompt(self, text: str) -> str:
         """Create prompt for order parsing"""
@@ -168,7 +185,7 @@ Return JSON:"""
                 try:
                     base_price = Decimal(str(base_price))
                 except (ValueError, TypeError):
-                    base_price = Decimal('0.00')
+                    base_price = _NO_CHARGE
                 
                 # Validate modifications
                 modifications = []
@@ -180,7 +197,7 @@ Return JSON:"""
                         try:
                             price_change = Decimal(str(price_change))
                         except (ValueError, TypeError):
-                            price_change = Decimal('0.00')
+                            price_change = _NO_CHARGE
                         
                         modifications.append({
                             'type': mod_type,
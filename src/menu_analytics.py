@@ -0,0 +1,224 @@
+"""
+Menu Analytics
+Catalog-wide price statistics computed as NumPy reductions
+"""
+
+import numpy as np
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.order_schema import MenuItemTemplate, SizeType, _MOD_BITS, _SIZE_BITS, _from_cents, _get_templates
+
+
+class MenuPriceTable:
+    """Column-oriented copy of menu prices for whole-catalog analytics.
+
+    Base prices are held as one int64 array of cents next to an array of
+    category codes, so sums, extremes and per-category aggregates are single
+    NumPy reductions instead of Python loops over Decimal objects. Offered
+    sizes are a bitmask column, so category, price and size filters combine
+    as and-ed masks. Size and modification upcharges sit in dense per-item tables for batch pricing.
+    Names are packed into one UTF-8 buffer with an offset array, so budget
+    filters can report hits without touching the template objects.
+    """
+
+    def __init__(self, menu_items: Sequence[MenuItemTemplate]):
+        self.categories: List[str] = []
+        category_codes: Dict[str, int] = {}
+        codes = []
+        for item in menu_items:
+            code = category_codes.get(item.category)
+            if code is None:
+                code = category_codes[item.category] = len(self.categories)
+                self.categories.append(item.category)
+            codes.append(code)
+
+        # Base prices in the narrowest integer type that holds them: uint16 (up
+        # to $655.35) for any real menu, widening automatically past that
+        prices = [item.base_price_cents for item in menu_items]
+        dtype = np.result_type(np.min_scalar_type(min(prices, default=0)), np.min_scalar_type(max(prices, default=0)))
+        self.prices_cents = np.array(prices, dtype=dtype)
+        # A menu has a handful of categories, so codes are normally one byte each
+        self.category_codes = np.array(codes, dtype=np.min_scalar_type(max(len(self.categories) - 1, 0)))
+        self._category_codes = category_codes
+        # One bit per offered size (the templates' size_mask)
+        self.size_masks = np.array([item.size_mask for item in menu_items],
+                                   dtype=np.min_scalar_type((1 << len(SizeType)) - 1))
+
+        # Prices grouped by category (stable, so catalog order within a group);
+        # per-category reductions become one reduceat over contiguous runs
+        self._category_counts = np.bincount(self.category_codes, minlength=len(self.categories))
+        self._category_starts = np.cumsum(self._category_counts) - self._category_counts
+        self._prices_by_category = self.prices_cents[np.argsort(self.category_codes, kind='stable')]
+
+        # Names as one UTF-8 buffer; name i spans name_offsets[i]:name_offsets[i + 1]
+        encoded = [item.name.encode() for item in menu_items]
+        self.name_buf = b''.join(encoded)
+        self.name_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in encoded], out=self.name_offsets[1:])
+
+        # Size and modification upcharges as dense (item, size) and (item, bit) tables
+        self.sizes = [size.value for size in SizeType]
+        self._size_codes = {size: code for code, size in enumerate(self.sizes)}
+        self.size_cents = np.zeros((len(menu_items), len(self.sizes)), dtype=np.int64)
+        self.mod_cents = np.zeros((len(menu_items), len(_MOD_BITS)), dtype=np.int64)
+        for row, item in enumerate(menu_items):
+            for size, cents in item.size_pricing_cents.items():
+                code = self._size_codes.get(size)
+                if code is not None:
+                    self.size_cents[row, code] = cents
+            for mod, cents in item.modification_pricing_cents.items():
+                self.mod_cents[row, _MOD_BITS[mod]] = cents
+
+    def name(self, template_id: int) -> str:
+        """Name of a template, sliced from the packed name buffer"""
+        return self.name_buf[self.name_offsets[template_id]:self.name_offsets[template_id + 1]].decode()
+
+    def within_budget(self, budget_cents: int, category: Optional[str] = None) -> np.ndarray:
+        """Ids of templates whose base price is at most budget_cents, ascending.
+
+        One vectorized comparison over the price column, narrowed to a
+        category when given; an unknown category matches nothing.
+        """
+        return self.select(category, max_cents=budget_cents)
+
+    def in_category(self, category: str) -> np.ndarray:
+        """Ids of templates in a category, ascending, from one compare over the code column"""
+        return np.flatnonzero(self._category_mask(category))
+
+    def select(self, category: Optional[str] = None, min_cents: Optional[int] = None,
+               max_cents: Optional[int] = None, size: Any = None) -> np.ndarray:
+        """Ids of templates passing every given filter, ascending.
+
+        Each filter is one compare over its column (category code, base price
+        in [min_cents, max_cents], size bitmask) and the masks are and-ed, so
+        combined filters never loop over templates. An unknown category or
+        size (a SizeType or its value) matches nothing.
+        """
+        hits = np.ones(self.prices_cents.size, dtype=bool)
+        if max_cents is not None:
+            hits &= self._at_most(max_cents)
+        if min_cents is not None:
+            hits &= ~self._at_most(min_cents - 1)
+        if category is not None:
+            hits &= self._category_mask(category)
+        if size is not None:
+            hits &= (self.size_masks & _SIZE_BITS.get(size, 0)) != 0
+        return np.flatnonzero(hits)
+
+    def _at_most(self, cents: int) -> np.ndarray:
+        # Clamp to the column's dtype so out-of-range bounds neither wrap nor raise
+        limits = np.iinfo(self.prices_cents.dtype)
+        if cents < limits.min:
+            return np.zeros(self.prices_cents.size, dtype=bool)
+        return self.prices_cents <= min(cents, limits.max)
+
+    def _category_mask(self, category: str) -> np.ndarray:
+        code = self._category_codes.get(category)
+        if code is None:
+            return np.zeros(self.category_codes.size, dtype=bool)
+        return self.category_codes == code
+
+    def price_lines(self, template_ids: Sequence[int], mod_masks: Optional[Sequence[int]] = None,
+                    sizes: Optional[Sequence[Optional[str]]] = None) -> np.ndarray:
+        """Unit prices in cents of many order lines at once.
+
+        Each line is a template id with an optional size value and a
+        ``modification_mask``; the result matches ``price_cents`` line by
+        line, computed as gathers and one masked row sum instead of a
+        Python loop per line.
+        """
+        ids = np.asarray(template_ids, dtype=np.intp)
+        totals = self.prices_cents[ids].astype(np.int64)
+        if sizes is not None:
+            codes = np.fromiter((self._size_codes.get(size, -1) for size in sizes), dtype=np.intp, count=ids.size)
+            sized = codes >= 0
+            totals[sized] += self.size_cents[ids[sized], codes[sized]]
+        if mod_masks is not None:
+            totals += (self.mod_cents[ids] * self._mask_bits(mod_masks, ids.size)).sum(axis=1)
+        return totals
+
+    def _mask_bits(self, mod_masks: Sequence[int], count: int) -> np.ndarray:
+        """Modification masks unpacked to one 0/1 column per bit of the upcharge table.
+
+        Bits past the table (modifications registered after it was built,
+        which none of its items price) are dropped. Up to 63 bits the masks
+        shift as int64; wider ones are unpacked from their little-endian bytes.
+        """
+        width = self.mod_cents.shape[1]
+        limit = (1 << width) - 1
+        if width <= 63:
+            try:
+                masks = np.asarray(mod_masks, dtype=np.int64) & limit
+            except OverflowError:  # a late bit past int64 itself; clip each mask first
+                masks = np.fromiter((mask & limit for mask in mod_masks), dtype=np.int64, count=count)
+            return (masks[:, None] >> np.arange(width, dtype=np.int64)) & 1
+        size = (width + 7) // 8
+        packed = b''.join((mask & limit).to_bytes(size, 'little') for mask in mod_masks)
+        bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8).reshape(count, size), axis=1, bitorder='little')
+        return bits[:, :width]
+
+    def order_total(self, template_ids: Sequence[int], quantities: Optional[Sequence[int]] = None,
+                    mod_masks: Optional[Sequence[int]] = None, sizes: Optional[Sequence[Optional[str]]] = None) -> int:
+        """Total in cents of a whole order, before tax.
+
+        The line prices from ``price_lines`` are weighted by quantity (one
+        each by default) in a single dot product, matching the sum of
+        ``total_cents`` over the lines.
+        """
+        prices = self.price_lines(template_ids, mod_masks, sizes)
+        if quantities is None:
+            return int(prices.sum())
+        return int(prices @ np.asarray(quantities, dtype=np.int64))
+
+    def summary(self) -> Dict[str, Any]:
+        """Item count and min / max / mean base price across the whole menu"""
+        if not self.prices_cents.size:
+            return {'count': 0, 'min': None, 'max': None, 'mean': None}
+        return {
+            'count': int(self.prices_cents.size),
+            'min': _to_price(self.prices_cents.min()),
+            'max': _to_price(self.prices_cents.max()),
+            'mean': _to_price(self.prices_cents.mean()),
+        }
+
+    def by_category(self) -> Dict[str, Dict[str, Any]]:
+        """Item count and min / max / mean base price per category, in first-seen order"""
+        counts = self._category_counts
+        grouped, starts = self._prices_by_category, self._category_starts
+        totals = np.add.reduceat(grouped, starts, dtype=np.int64)
+        lows = np.minimum.reduceat(grouped, starts)
+        highs = np.maximum.reduceat(grouped, starts)
+
+        return {
+            category: {
+                'count': int(counts[code]),
+                'min': _to_price(lows[code]),
+                'max': _to_price(highs[code]),
+                'mean': _to_price(totals[code] / counts[code]),
+            }
+            for code, category in enumerate(self.categories)
+        }
+
+
+def _to_price(cents: Any) -> Decimal:
+    """Convert a NumPy cents value to a two-place Decimal price (memoized, like template prices)"""
+    return _from_cents(int(round(float(cents))))
+
+
+_PRICE_TABLE_CACHE: Optional[MenuPriceTable] = None
+
+
+def _get_price_table() -> MenuPriceTable:
+    """Return the price table over TEMPLATES, building it on first use"""
+    global _PRICE_TABLE_CACHE
+    if _PRICE_TABLE_CACHE is None:
+        _PRICE_TABLE_CACHE = MenuPriceTable(_get_templates())
+    return _PRICE_TABLE_CACHE
+
+
+def __getattr__(name: str) -> Any:
+    """Build PRICE_TABLE lazily alongside the TEMPLATES it covers (PEP 562)"""
+    if name == 'PRICE_TABLE':
+        return _get_price_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
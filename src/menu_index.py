@@ -0,0 +1,704 @@
+"""
+Menu Keyword Index
+Compiled keyword matching over menu item templates
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from src.order_schema import MenuItemTemplate, _get_templates, _is_sample_menu, category_ids
+from src.text_patterns import trie_pattern
+
+try:  # Intel Hyperscan: SIMD multi-pattern DFA, reports every (overlapping) match
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:  # pyahocorasick: Aho-Corasick automaton in C, reports every (overlapping) match
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _encode_postings(ids: Sequence[int], out: bytearray) -> None:
+    """Append sorted ids to out as delta-encoded LEB128 varints"""
+    previous = 0
+    for value in ids:
+        delta = value - previous
+        previous = value
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+
+
+def _varint_iter(buf: memoryview) -> Iterator[int]:
+    """Decode a delta-encoded varint posting list back into ids"""
+    value = shift = previous = 0
+    for byte in buf:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += value
+        yield previous
+        value = shift = 0
+
+
+def _collect_match(keyword_id: int, start: int, end: int, flags: int, found: set) -> None:
+    """Hyperscan match handler: record the keyword id in the scan's context set"""
+    found.add(keyword_id)
+
+
+def _collect_end(keyword_id: int, start: int, end: int, flags: int, hits: List[Tuple[int, int]]) -> None:
+    """Hyperscan match handler: record (end byte offset, keyword id) in the scan's context list"""
+    hits.append((end, keyword_id))
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for a regex ``\\b``"""
+    return char.isalnum() or char == '_'
+
+
+class KeywordScanner:
+    """Find which of a fixed list of keywords occur in a piece of text in one pass.
+
+    Keywords are numbered in list order (duplicates keep their first id) and
+    compiled once: into a Hyperscan database when installed, then a
+    pyahocorasick automaton, then a stdlib ``re`` trie-shaped pattern. An
+    empty keyword is kept out of the compiled pattern (Hyperscan rejects it
+    and the regex would match empty forever) and, like ``'' in text``,
+    occurs in every text.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords: List[str] = []
+        self._keyword_ids: Dict[str, int] = {}
+        for keyword in keywords:
+            if keyword not in self._keyword_ids:
+                self._keyword_ids[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+
+        self._database = None
+        self._automaton = None
+        self._pattern = None
+        self._prefixes: List[List[int]] = []
+        self._empty_id = self._keyword_ids.get('')
+        compiled = [(keyword_id, kw) for keyword_id, kw in enumerate(self.keywords) if kw]
+        if not compiled:
+            return
+
+        if hyperscan is not None:
+            self._database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self._database.compile(
+                expressions=[''.join('\\x%02x' % byte for byte in kw.encode()).encode() for _, kw in compiled],
+                ids=[keyword_id for keyword_id, _ in compiled],
+                elements=len(compiled),
+            )
+            return
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword_id, keyword in compiled:
+                self._automaton.add_word(keyword, keyword_id)
+            self._automaton.make_automaton()
+            return
+
+        self._pattern = re.compile(trie_pattern([kw for _, kw in compiled]))
+
+        # The regex reports the longest keyword starting at each position; the
+        # shorter keywords starting there are exactly its keyword prefixes.
+        self._prefixes = [
+            [self._keyword_ids[kw[:end]] for end in range(1, len(kw)) if kw[:end] in self._keyword_ids]
+            for kw in self.keywords
+        ]
+
+    def find(self, text: str) -> List[int]:
+        """Return ids of all keywords occurring in text, in first-seen order"""
+        found = set()
+        if self._empty_id is not None:
+            found.add(self._empty_id)
+        if self._database is not None:
+            self._database.scan(text.encode(), match_event_handler=_collect_match, context=found)
+        elif self._automaton is not None:
+            found.update(keyword_id for _, keyword_id in self._automaton.iter(text))
+        elif self._pattern is not None:
+            pos = 0
+            while True:
+                match = self._pattern.search(text, pos)
+                if match is None:
+                    break
+                keyword_id = self._keyword_ids[match.group()]
+                found.add(keyword_id)
+                found.update(self._prefixes[keyword_id])
+                pos = match.start() + 1
+                if pos > len(text):
+                    break
+        return sorted(found)
+
+    def occurrences(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start, keyword id) for every occurrence of every keyword in text, overlaps included.
+
+        Same single scan as ``find``, but reporting where each keyword
+        occurs; the order of occurrences is unspecified.
+        """
+        if self._empty_id is not None:
+            for start in range(len(text) + 1):
+                yield start, self._empty_id
+        if self._database is not None:
+            data = text.encode()
+            hits: List[Tuple[int, int]] = []
+            self._database.scan(data, match_event_handler=_collect_end, context=hits)
+            for end, keyword_id in hits:
+                start = end - len(self.keywords[keyword_id].encode())
+                # Hyperscan reports byte offsets; map them back to characters for non-ASCII text
+                yield (start if len(data) == len(text) else len(data[:start].decode())), keyword_id
+        elif self._automaton is not None:
+            for end, keyword_id in self._automaton.iter(text):
+                yield end - len(self.keywords[keyword_id]) + 1, keyword_id
+        elif self._pattern is not None:
+            pos = 0
+            while True:
+                match = self._pattern.search(text, pos)
+                if match is None:
+                    break
+                keyword_id = self._keyword_ids[match.group()]
+                yield match.start(), keyword_id
+                for prefix_id in self._prefixes[keyword_id]:
+                    yield match.start(), prefix_id
+                pos = match.start() + 1
+                if pos > len(text):
+                    break
+
+    def find_whole_words(self, text: str) -> List[int]:
+        """Ids of keywords occurring in text as whole words, ascending"""
+        return [keyword_id for keyword_id in self.find(text) if self.occurs_as_word(keyword_id, text)]
+
+    def occurs_as_word(self, keyword_id: int, text: str) -> bool:
+        """Whether a keyword occurs in text between word boundaries.
+
+        Agrees with ``re.search(r'\\b' + re.escape(keyword) + r'\\b', text)``
+        but checks the characters around each ``str.find`` hit directly, so
+        no pattern is built, escaped or looked up in the regex cache.
+        """
+        keyword = self.keywords[keyword_id]
+        if not keyword:  # r'\b\b' holds wherever there is any word boundary
+            return any(_is_word_char(char) for char in text)
+        starts_word, ends_word = _is_word_char(keyword[0]), _is_word_char(keyword[-1])
+        pos = text.find(keyword)
+        while pos != -1:
+            end = pos + len(keyword)
+            if ((pos > 0 and _is_word_char(text[pos - 1])) != starts_word
+                    and (end < len(text) and _is_word_char(text[end])) != ends_word):
+                return True
+            pos = text.find(keyword, pos + 1)
+        return False
+
+    def keyword_id(self, keyword: str) -> Optional[int]:
+        """Id of a keyword, or None if it is not in the list"""
+        return self._keyword_ids.get(keyword)
+
+
+class KeywordMatcher(KeywordScanner):
+    """Match every menu keyword contained in a piece of text in a single pass.
+
+    Keywords are lowercased and numbered in first-seen order, and each keyword
+    resolves to the last template that lists it, mirroring the
+    ``{keyword.lower(): item}`` dictionaries the parsers used to rebuild per
+    query. Scanning is the compiled ``KeywordScanner`` pass.
+
+    Posting lists hold integer template ids (positions in ``menu_items``, which
+    match ``template_id`` for the full TEMPLATES), so filter-only queries
+    never touch the template objects. They are stored sorted, delta-encoded
+    and varint-packed in one ``bytes`` blob, with one flat array of offsets
+    into it (keyword i spans offsets i to i + 1) and one array of the
+    template each keyword resolves to, so no Python object is kept per
+    posting list; most postings fit in a byte or two per keyword.
+    """
+
+    def __init__(self, menu_items: Sequence[MenuItemTemplate]):
+        self.menu_items = list(menu_items)
+        keywords: List[str] = []
+        keyword_ids: Dict[str, int] = {}
+        typecode = 'H' if len(self.menu_items) <= 0xFFFF else 'I'
+
+        postings: List[List[int]] = []
+        for template_id, item in enumerate(self.menu_items):
+            for keyword in item.keywords:
+                lowered = keyword.lower()
+                if lowered != keyword:  # catalog keywords are lowercase: keep the template's string, not a copy
+                    keyword = lowered
+                keyword_id = keyword_ids.get(keyword)
+                if keyword_id is None:
+                    keyword_id = keyword_ids[keyword] = len(keywords)
+                    keywords.append(keyword)
+                    postings.append([])
+                if not postings[keyword_id] or postings[keyword_id][-1] != template_id:
+                    postings[keyword_id].append(template_id)
+
+        blob = bytearray()
+        self._postings_offsets = array('I', [0])  # keyword i spans offsets[i]:offsets[i + 1]
+        for ids in postings:
+            _encode_postings(ids, blob)
+            self._postings_offsets.append(len(blob))
+        self._postings_blob = bytes(blob)
+        self._postings_view = memoryview(self._postings_blob)
+        self._last_template = array(typecode, (ids[-1] for ids in postings))
+
+        self._blobs_by_length: Optional[Dict[int, Tuple[str, List[int]]]] = None
+        self._sorted_keywords: Optional[List[str]] = None
+        self._sorted_keyword_ids: List[int] = []
+        self._max_keyword_length = 0
+        self._keyword_items: Optional[Mapping[str, MenuItemTemplate]] = None
+        super().__init__(keywords)
+
+    def partial_matches(self, words: Sequence[str], min_length: int = 4, ratio: float = 0.6) -> List[int]:
+        """Ids of keywords sharing a large part with any of words, in first-seen order.
+
+        A keyword and a word (both at least ``min_length`` long) match when
+        one contains the other and the contained one is at least ``ratio``
+        of the other's length. Keywords inside a word come from one scan of
+        the word. Words inside keywords come from ``str.find`` over the
+        keywords of each length joined by newlines, so no loop runs per
+        keyword, and only the lengths the ratio allows are searched.
+        """
+        blobs = self._length_blobs()
+        found = set()
+        for word in words:
+            if len(word) < min_length:
+                continue
+            for keyword_id in self.find(word):
+                keyword = self.keywords[keyword_id]
+                if len(keyword) >= min_length and len(keyword) >= len(word) * ratio:
+                    found.add(keyword_id)
+            for length in range(max(len(word), min_length), self._max_keyword_length + 1):
+                if len(word) < length * ratio:
+                    break  # longer keywords only dilute the word further
+                if length in blobs:
+                    self._scan_bucket(blobs[length], length, word, found)
+        return sorted(found)
+
+    def keywords_containing(self, fragment: str) -> List[int]:
+        """Ids of keywords containing fragment (case-insensitive), ascending.
+
+        A columnar scan: one ``str.find`` pass over each packed keyword
+        column at least as long as the fragment, with no loop per keyword.
+        An empty fragment is in every keyword; one containing a newline
+        (the column separator) is in none.
+        """
+        if '\n' in fragment:
+            return []
+        fragment = fragment.lower()
+        found: set = set()
+        for length, bucket in self._length_blobs().items():
+            if length >= len(fragment):
+                self._scan_bucket(bucket, length, fragment, found)
+        return sorted(found)
+
+    def keywords_with_prefix(self, prefix: str) -> List[int]:
+        """Ids of keywords starting with prefix (case-insensitive), ascending.
+
+        Keywords are kept sorted on first use, so the matching ones form one
+        contiguous run found with a binary search.
+        """
+        if self._sorted_keywords is None:
+            order = sorted(range(len(self.keywords)), key=self.keywords.__getitem__)
+            self._sorted_keywords = [self.keywords[keyword_id] for keyword_id in order]
+            self._sorted_keyword_ids = order
+        prefix = prefix.lower()
+        start = bisect_left(self._sorted_keywords, prefix)
+        end = start
+        while end < len(self._sorted_keywords) and self._sorted_keywords[end].startswith(prefix):
+            end += 1
+        return sorted(self._sorted_keyword_ids[start:end])
+
+    def _length_blobs(self) -> Dict[int, Tuple[str, List[int]]]:
+        """Keywords packed into one newline-joined column per length, built on first use"""
+        if self._blobs_by_length is None:
+            by_length: Dict[int, List[int]] = {}
+            for keyword_id, keyword in enumerate(self.keywords):
+                by_length.setdefault(len(keyword), []).append(keyword_id)
+            self._blobs_by_length = {
+                length: ('\n'.join(self.keywords[keyword_id] for keyword_id in ids), ids)
+                for length, ids in by_length.items()
+            }
+            self._max_keyword_length = max(by_length, default=0)
+        return self._blobs_by_length
+
+    @staticmethod
+    def _scan_bucket(bucket: Tuple[str, List[int]], length: int, fragment: str, found: set) -> None:
+        """Add the ids of a length bucket's keywords containing fragment to found"""
+        blob, ids = bucket
+        pos = blob.find(fragment)
+        while pos != -1:
+            # Same-length keywords, so a hit's slot is pos // (length + 1)
+            found.add(ids[pos // (length + 1)])
+            pos = blob.find(fragment, pos + 1)
+
+    def best_match(self, text: str) -> Optional[MenuItemTemplate]:
+        """Template of the longest keyword occurring in text (the most specific one)"""
+        keyword_ids = self.find(text)
+        if not keyword_ids:
+            return None
+        return self.item_for(max(keyword_ids, key=lambda keyword_id: len(self.keywords[keyword_id])))
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Return all keywords occurring in text, in first-seen order"""
+        return [self.keywords[keyword_id] for keyword_id in self.find(text)]
+
+    def postings(self, keyword_id: int) -> Iterator[int]:
+        """Iterate the template ids listing a keyword, in ascending order"""
+        offsets = self._postings_offsets
+        return _varint_iter(self._postings_view[offsets[keyword_id]:offsets[keyword_id + 1]])
+
+    def shared_templates(self, first_id: int, second_id: int) -> List[int]:
+        """Template ids listing both keywords, co-walking the two varint streams"""
+        shared = []
+        first, second = self.postings(first_id), self.postings(second_id)
+        a, b = next(first, None), next(second, None)
+        while a is not None and b is not None:
+            if a == b:
+                shared.append(a)
+                a, b = next(first, None), next(second, None)
+            elif a < b:
+                a = next(first, None)
+            else:
+                b = next(second, None)
+        return shared
+
+    def template_ids(self, text: str) -> List[int]:
+        """Return ids of all templates with a keyword occurring in text"""
+        ids = set()
+        for keyword_id in self.find(text):
+            ids.update(self.postings(keyword_id))
+        return sorted(ids)
+
+    def count(self, text: str) -> int:
+        """Number of templates with a keyword occurring in text"""
+        return len(self.template_ids(text))
+
+    def item_for(self, keyword_id: int) -> MenuItemTemplate:
+        """Template a keyword resolves to (the last one listing it)"""
+        return self.menu_items[self._last_template[keyword_id]]
+
+    def keyword_items(self) -> Mapping[str, MenuItemTemplate]:
+        """Read-only map from each keyword to the template it resolves to, built once.
+
+        The same ``{keyword.lower(): item}`` table the parsers used to build
+        per instance, read off the posting lists.
+        """
+        if self._keyword_items is None:
+            self._keyword_items = MappingProxyType(
+                {keyword: self.menu_items[template_id] for keyword, template_id in zip(self.keywords, self._last_template)})
+        return self._keyword_items
+
+    def keyword_id(self, keyword: str) -> Optional[int]:
+        """Id of a keyword, or None if no template lists it"""
+        return self._keyword_ids.get(keyword.lower())
+
+
+class TokenIndex:
+    """Inverted index from keyword tokens to template ids.
+
+    Every whitespace-separated token of every keyword maps to the sorted ids
+    of the templates using it, so a query resolves to the intersection of a
+    few posting lists rather than a scan over all templates. Each posting
+    list is mirrored as a bitmap (bit i set for template id i): the
+    intersection is one AND per token, and the shortest list is then
+    filtered against it, which keeps the ids sorted without a sort.
+    """
+
+    def __init__(self, menu_items: Sequence[MenuItemTemplate]):
+        self.menu_items = list(menu_items)
+        self.postings: Dict[str, List[int]] = {}
+        self.bitmaps: Dict[str, int] = {}
+
+        for template_id, item in enumerate(self.menu_items):
+            for keyword in item.keywords:
+                for token in keyword.lower().split():
+                    ids = self.postings.setdefault(token, [])
+                    if not ids or ids[-1] != template_id:
+                        ids.append(template_id)
+                        self.bitmaps[token] = self.bitmaps.get(token, 0) | (1 << template_id)
+
+    def candidates(self, query: str) -> List[int]:
+        """Ids of templates whose keywords contain every known token of query"""
+        tokens = [token for token in query.lower().split() if token in self.postings]
+        if not tokens:
+            return []
+        shortest = min(tokens, key=lambda token: len(self.postings[token]))
+        bitmap = -1
+        for token in tokens:
+            bitmap &= self.bitmaps[token]
+        if bitmap == self.bitmaps[shortest]:
+            return list(self.postings[shortest])
+        return [template_id for template_id in self.postings[shortest] if bitmap >> template_id & 1]
+
+    def lookup(self, query: str) -> List[MenuItemTemplate]:
+        """Templates whose keywords contain every known token of query"""
+        return [self.menu_items[template_id] for template_id in self.candidates(query)]
+
+
+def _levenshtein_row(text: str, char: str, previous: List[int]) -> Tuple[List[int], int]:
+    """Next row of the Levenshtein table after appending char, and its minimum.
+
+    Each cell is min(left, above) + 1 or the diagonal plus the substitution
+    cost, computed with plain comparisons over zipped rows instead of
+    indexing and a three-way min() call per cell.
+    """
+    left = low = previous[0] + 1
+    row = [left]
+    for text_char, diagonal, above in zip(text, previous, previous[1:]):
+        if above < left:
+            left = above
+        left += 1
+        if text_char == char:
+            if diagonal < left:
+                left = diagonal
+        elif diagonal < left - 1:
+            left = diagonal + 1
+        if left < low:
+            low = left
+        row.append(left)
+    return row, low
+
+
+class NameTrie:
+    """Read-only trie over lowercased template names with typo-tolerant search.
+
+    ``search`` walks the trie carrying one row of the Levenshtein table per
+    node and prunes any branch whose row already exceeds the correction
+    budget, so a lookup costs roughly O(len(query)) trie steps per surviving
+    branch instead of a comparison against every name.
+
+    ``prefix_ids`` descends the same trie for autocomplete; ``infix_ids``
+    finds names containing a fragment with ``str.find`` over all names
+    joined by newlines, mapping each hit back to its name with bisect.
+    """
+
+    def __init__(self, menu_items: Sequence[MenuItemTemplate]):
+        self.menu_items = list(menu_items)
+        self._root: Dict[str, Any] = {}
+        self._name_ids: Dict[str, int] = {}
+        self._ids_by_name: Dict[str, List[int]] = {}
+
+        for template_id, item in enumerate(self.menu_items):
+            name = item.name.lower()
+            self._name_ids[name] = template_id
+            self._ids_by_name.setdefault(name, []).append(template_id)
+            node = self._root
+            for char in name:
+                node = node.setdefault(char, {})
+            node[''] = name
+
+        # Offsets of each name in the blob, plus one past the end as a sentinel
+        names = [item.name.lower() for item in self.menu_items]
+        self._names_blob = '\n'.join(names)
+        self._name_starts: List[int] = [0]
+        for name in names:
+            self._name_starts.append(self._name_starts[-1] + len(name) + 1)
+
+    def search(self, text: str, correction_budget: int = 1) -> Tuple[Optional[str], int]:
+        """Closest name within correction_budget edits of text, and its distance"""
+        text = text.lower()
+        if text in self._name_ids:
+            return text, 0
+
+        best: List[Any] = [None, correction_budget + 1]
+
+        def walk(node: Dict[str, Any], char: str, previous: List[int]) -> None:
+            row, low = _levenshtein_row(text, char, previous)
+            if '' in node and row[-1] < best[1]:
+                best[0], best[1] = node[''], row[-1]
+            if low < best[1]:
+                for next_char, child in node.items():
+                    if next_char:
+                        walk(child, next_char, row)
+
+        first_row = list(range(len(text) + 1))
+        for char, child in self._root.items():
+            if char:
+                walk(child, char, first_row)
+
+        if best[0] is None:
+            return None, -1
+        return best[0], best[1]
+
+    def lookup(self, text: str, correction_budget: int = 1) -> Optional[MenuItemTemplate]:
+        """Template whose name is closest to text, or None if none is in budget"""
+        name, _ = self.search(text, correction_budget)
+        if name is None:
+            return None
+        return self.menu_items[self._name_ids[name]]
+
+    def within(self, text: str, max_distance: int = 2) -> List[Tuple[int, int]]:
+        """(template id, distance) for every name within max_distance edits of text.
+
+        Same pruned Levenshtein walk as ``search``, but against a fixed bound
+        so every name in range is reported, closest first (ties by id).
+        """
+        text = text.lower()
+        hits: List[Tuple[int, int]] = []
+
+        def walk(node: Dict[str, Any], char: str, previous: List[int]) -> None:
+            row, low = _levenshtein_row(text, char, previous)
+            if '' in node and row[-1] <= max_distance:
+                hits.extend((template_id, row[-1]) for template_id in self._ids_by_name[node['']])
+            if low <= max_distance:
+                for next_char, child in node.items():
+                    if next_char:
+                        walk(child, next_char, row)
+
+        first_row = list(range(len(text) + 1))
+        if '' in self._root and len(text) <= max_distance:
+            hits.extend((template_id, len(text)) for template_id in self._ids_by_name[self._root['']])
+        for char, child in self._root.items():
+            if char:
+                walk(child, char, first_row)
+
+        hits.sort(key=lambda hit: (hit[1], hit[0]))
+        return hits
+
+    def name_ids(self, name: str) -> List[int]:
+        """Ids of templates named exactly name (ignoring case), ascending"""
+        return list(self._ids_by_name.get(name.lower(), ()))
+
+    def prefix_ids(self, prefix: str) -> List[int]:
+        """Ids of templates whose name starts with prefix (ignoring case), ascending"""
+        node = self._root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+
+        ids: List[int] = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char:
+                    stack.append(child)
+                else:
+                    ids.extend(self._ids_by_name[child])
+        return sorted(ids)
+
+    def infix_ids(self, text: str) -> List[int]:
+        """Ids of templates whose name contains text (ignoring case), ascending"""
+        text = text.lower()
+        if not text:
+            return list(range(len(self.menu_items)))
+        if '\n' in text:
+            return []
+
+        ids = []
+        pos = self._names_blob.find(text)
+        while pos != -1:
+            template_id = bisect_right(self._name_starts, pos) - 1
+            ids.append(template_id)
+            # Resume at the next name: one hit per template is enough
+            pos = self._names_blob.find(text, self._name_starts[template_id + 1])
+        return ids
+
+
+_KEYWORD_MATCHER_CACHE: Optional[KeywordMatcher] = None
+_TOKEN_INDEX_CACHE: Optional[TokenIndex] = None
+_NAME_TRIE_CACHE: Optional[NameTrie] = None
+
+
+def _get_keyword_matcher() -> KeywordMatcher:
+    """Return the keyword matcher over TEMPLATES, building it on first use"""
+    global _KEYWORD_MATCHER_CACHE
+    if _KEYWORD_MATCHER_CACHE is None:
+        _KEYWORD_MATCHER_CACHE = KeywordMatcher(_get_templates())
+    return _KEYWORD_MATCHER_CACHE
+
+
+def keyword_matcher_for(menu_items: Sequence[MenuItemTemplate]) -> KeywordMatcher:
+    """Keyword matcher for menu_items, sharing the compiled one for the sample menu"""
+    if _is_sample_menu(menu_items):
+        return _get_keyword_matcher()
+    return KeywordMatcher(menu_items)
+
+
+def keyword_scanner_for(keywords: Sequence[str]) -> KeywordScanner:
+    """Keyword scanner for a keyword list, compiled once per distinct list"""
+    return _keyword_scanner(tuple(keywords))
+
+
+@lru_cache(maxsize=None)
+def _keyword_scanner(keywords: Tuple[str, ...]) -> KeywordScanner:
+    return KeywordScanner(keywords)
+
+
+def find_items(query: str, category: Optional[str] = None) -> List[int]:
+    """Ids of TEMPLATES items with a keyword occurring in query, in one scan.
+
+    With a category, the category index is consulted first: an unknown
+    category returns without scanning, otherwise hits are kept only if the
+    category holds them.
+    """
+    if category is None:
+        return _get_keyword_matcher().template_ids(query.lower())
+    ids = category_ids(category)
+    if not ids:
+        return []
+    return [template_id for template_id in _get_keyword_matcher().template_ids(query.lower()) if template_id in ids]
+
+
+def lookup_keyword(keyword: str) -> List[int]:
+    """Ids of TEMPLATES items listing keyword or named exactly keyword (ignoring case), ascending.
+
+    Two dict hits, the keyword's posting list and the name table, instead of
+    a scan over every template's keyword list.
+    """
+    matcher = _get_keyword_matcher()
+    keyword_id = matcher.keyword_id(keyword)
+    ids = set(matcher.postings(keyword_id)) if keyword_id is not None else set()
+    ids.update(_get_name_trie().name_ids(keyword))
+    return sorted(ids)
+
+
+def fuzzy_find(query: str, max_distance: int = 2) -> List[int]:
+    """Ids of TEMPLATES items whose name is within max_distance edits of query, closest first"""
+    return [template_id for template_id, _ in _get_name_trie().within(query, max_distance)]
+
+
+def find_by_prefix(prefix: str) -> List[int]:
+    """Ids of TEMPLATES items whose name starts with prefix, for autocomplete"""
+    return _get_name_trie().prefix_ids(prefix)
+
+
+def find_containing(text: str) -> List[int]:
+    """Ids of TEMPLATES items whose name contains text"""
+    return _get_name_trie().infix_ids(text)
+
+
+def _get_token_index() -> TokenIndex:
+    """Return the token index over TEMPLATES, building it on first use"""
+    global _TOKEN_INDEX_CACHE
+    if _TOKEN_INDEX_CACHE is None:
+        _TOKEN_INDEX_CACHE = TokenIndex(_get_templates())
+    return _TOKEN_INDEX_CACHE
+
+
+def _get_name_trie() -> NameTrie:
+    """Return the name trie over TEMPLATES, building it on first use"""
+    global _NAME_TRIE_CACHE
+    if _NAME_TRIE_CACHE is None:
+        _NAME_TRIE_CACHE = NameTrie(_get_templates())
+    return _NAME_TRIE_CACHE
+
+
+def __getattr__(name: str) -> Any:
+    """Build the indexes lazily alongside the TEMPLATES they cover (PEP 562)"""
+    if name == 'KEYWORD_MATCHER':
+        return _get_keyword_matcher()
+    if name == 'TOKEN_INDEX':
+        return _get_token_index()
+    if name == 'NAME_TRIE':
+        return _get_name_trie()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
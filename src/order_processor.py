@@ -14,6 +14,10 @@ from src.baseline_order_parser import BaselineOrderParser
 from src.llm_order_parser import LLMOrderParser, MockLLMOrderParser, get_order_parser
 from src.llm_enricher import LLMConfig
 
+_ZERO_TOTAL = Decimal('0.00')
+# Total difference above which the two parsers are reported as disagreeing
+_SIGNIFICANT_PRICE_DIFF = Decimal('0.50')
+
 
 @dataclass
 class OrderProcessingResult:
@@ -126,8 +130,8 @@ class OrderProcessor:
         comparison = {
             'baseline_items': 0,
             'llm_items': 0,
-            'baseline_total': Decimal('0.00'),
-            'llm_total': Decimal('0.00'),
+            'baseline_total': _ZERO_TOTAL,
+            'llm_total': _ZERO_TOTAL,
             'baseline_time': result.baseline_time,
             'llm_time': result.llm_time,
             'accuracy_metrics': {},
@@ -160,7 +164,7 @@ class OrderProcessor:
             
             # Price differences
             price_diff = abs(comparison['llm_total'] - comparison['baseline_total'])
-            if price_diff > Decimal('0.50'):  # Significant price difference
+            if price_diff > _SIGNIFICANT_PRICE_DIFF:  # Significant price difference
                 comparison['differences'].append(f"Price difference: ${price_diff:.2f}")
         
         return comparison
@@ -273,11 +277,7 @@ class OrderProcessor:
         lines.append("📋 AVAILABLE MENU ITEMS")
         lines.append("=" * 50)
         
-        categories = {}
-        for item in self.menu_items:
-            if item.category not in categories:
-                categories[item.category] = []
-            categories[item.category].append(item)
+        categories = OrderSchema.group_by_category(self.menu_items)
         
         for category, items in categories.items():
             lines.append(f"\n🍽️ {category.upper()}")
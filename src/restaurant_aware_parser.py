@@ -9,8 +9,13 @@ from decimal import Decimal
 import logging
 from src.order_schema import (
     Order, OrderItem, Modification, MenuItemTemplate, OrderSchema,
-    SizeType, ModificationType
+    SizeType, ModificationType, _is_sample_menu
 )
+from src.menu_index import KeywordMatcher, keyword_matcher_for, keyword_scanner_for
+
+# Restaurant keyword table -> (name index, restaurant buckets) of the sample menu,
+# which every parser over TEMPLATES would otherwise rebuild item by item
+_SAMPLE_MENU_INDEXES: Dict[Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[Dict[str, MenuItemTemplate], Dict[str, List[MenuItemTemplate]]]] = {}
 
 
 class RestaurantAwareOrderParser:
@@ -110,31 +115,70 @@ class RestaurantAwareOrderParser:
     
     def _build_indexes(self):
         """Build keyword indexes for menu items"""
-        self.name_to_item = {}
-        self.keyword_to_item = {}
-        self.restaurant_to_items = {}
-        
+        self.keyword_matcher = keyword_matcher_for(self.menu_items)
+        # Shared with every parser over the same menu, so read-only
+        self.keyword_to_item = self.keyword_matcher.keyword_items()
+        self._keyword_matchers = {}
+        
+        # Every restaurant keyword in one compiled scanner; each keyword id maps
+        # to the (restaurant index, list position) slots that list it
+        self._restaurant_names = list(self.restaurant_keywords)
+        self._restaurant_scanner = keyword_scanner_for(
+            [keyword for keywords in self.restaurant_keywords.values() for keyword in keywords])
+        self._restaurant_slots = [[] for _ in self._restaurant_scanner.keywords]
+        for index, keywords in enumerate(self.restaurant_keywords.values()):
+            for position, keyword in enumerate(keywords):
+                keyword_id = self._restaurant_scanner.keyword_id(keyword)
+                self._restaurant_slots[keyword_id].append((index, position, keyword_id))
+        
+        # The sample menu's indexes depend only on the restaurant table, so they
+        # are built once per process; each parser gets its own copies
+        if _is_sample_menu(self.menu_items):
+            key = tuple((restaurant, tuple(keywords)) for restaurant, keywords in self.restaurant_keywords.items())
+            indexes = _SAMPLE_MENU_INDEXES.get(key)
+            if indexes is None:
+                indexes = _SAMPLE_MENU_INDEXES[key] = self._index_items()
+            name_to_item, restaurant_to_items = indexes
+            self.name_to_item = dict(name_to_item)
+            self.restaurant_to_items = {restaurant: list(items) for restaurant, items in restaurant_to_items.items()}
+        else:
+            self.name_to_item, self.restaurant_to_items = self._index_items()
+    
+    def _index_items(self) -> Tuple[Dict[str, MenuItemTemplate], Dict[str, List[MenuItemTemplate]]]:
+        """Index menu items by lowercased name and by restaurant"""
+        name_to_item = {}
+        restaurant_to_items = {}
         for item in self.menu_items:
             # Index by exact name
-            self.name_to_item[item.name.lower()] = item
-            
-            # Index by keywords
-            for keyword in item.keywords:
-                self.keyword_to_item[keyword.lower()] = item
+            name_to_item[item.name.lower()] = item
             
             # Index by restaurant
             restaurant = self._identify_item_restaurant(item)
-            if restaurant not in self.restaurant_to_items:
-                self.restaurant_to_items[restaurant] = []
-            self.restaurant_to_items[restaurant].append(item)
+            if restaurant not in restaurant_to_items:
+                restaurant_to_items[restaurant] = []
+            restaurant_to_items[restaurant].append(item)
+        return name_to_item, restaurant_to_items
+    
+    def _get_keyword_matcher(self, items: List[MenuItemTemplate]) -> KeywordMatcher:
+        """Get a compiled keyword matcher for a list of menu items, building it once"""
+        if items is self.menu_items:
+            return self.keyword_matcher
+        
+        key = tuple(map(id, items))
+        matcher = self._keyword_matchers.get(key)
+        if matcher is None:
+            matcher = self._keyword_matchers[key] = KeywordMatcher(items)
+        return matcher
     
     def _identify_item_restaurant(self, item: MenuItemTemplate) -> str:
         """Identify which restaurant an item belongs to"""
         name_lower = item.name.lower()
         
-        for restaurant, keywords in self.restaurant_keywords.items():
-            if any(keyword in name_lower for keyword in keywords):
-                return restaurant
+        # First restaurant (in table order) listing any keyword found in the name
+        indexes = [index for keyword_id in self._restaurant_scanner.find(name_lower)
+                   for index, _, _ in self._restaurant_slots[keyword_id]]
+        if indexes:
+            return self._restaurant_names[min(indexes)]
         
         return "General"
     
@@ -143,20 +187,19 @@ class RestaurantAwareOrderParser:
         text_lower = text.lower()
         restaurant_scores = {}
         
-        # Check for explicit restaurant mentions
-        for restaurant, keywords in self.restaurant_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    # Longer keywords get higher scores
-                    keyword_score = len(keyword) / 10.0
-                    # Exact word boundaries get bonus
-                    if re.search(r'\\b' + re.escape(keyword) + r'\\b', text_lower):
-                        keyword_score *= 1.5
-                    score += keyword_score
-            
-            if score > 0:
-                restaurant_scores[restaurant] = score
+        # One scan finds every keyword present; slots are visited in restaurant
+        # and keyword-list order, so scores add up as in a per-restaurant loop
+        slots = sorted(slot for keyword_id in self._restaurant_scanner.find(text_lower)
+                       for slot in self._restaurant_slots[keyword_id])
+        for index, _, keyword_id in slots:
+            keyword = self._restaurant_scanner.keywords[keyword_id]
+            # Longer keywords get higher scores
+            keyword_score = len(keyword) / 10.0
+            # Exact word boundaries get bonus
+            if re.search(r'\\b' + re.escape(keyword) + r'\\b', text_lower):
+                keyword_score *= 1.5
+            restaurant = self._restaurant_names[index]
+            restaurant_scores[restaurant] = restaurant_scores.get(restaurant, 0) + keyword_score
         
         if not restaurant_scores:
             return None, 0.0
@@ -215,11 +258,10 @@ class RestaurantAwareOrderParser:
         }
         
         for i, word in enumerate(words):
-            qty = None
             if word.isdigit():
                 qty = int(word)
-            elif word in number_words:
-                qty = number_words[word]
+            else:
+                qty = number_words.get(word)
             
             if qty and qty > 0 and i + 1 < len(words):
                 # Look for menu item keywords in next few words
@@ -227,10 +269,9 @@ class RestaurantAwareOrderParser:
                 search_text = ' '.join(search_window).lower()
                 
                 # Find matching keywords
-                for keyword in self.keyword_to_item.keys():
-                    if keyword in search_text:
-                        quantities[keyword] = qty
-                        break
+                for keyword in self.keyword_matcher.find_keywords(search_text):
+                    quantities[keyword] = qty
+                    break
         
         return quantities
     
@@ -247,12 +288,9 @@ class RestaurantAwareOrderParser:
         
         words = text.split()
         for i, word in enumerate(words):
-            size_found = None
-            
-            if word in size_patterns:
-                size_found = size_patterns[word]
-            elif i + 1 < len(words) and f"{word} {words[i+1]}" in size_patterns:
-                size_found = size_patterns[f"{word} {words[i+1]}"]
+            size_found = size_patterns.get(word)
+            if size_found is None and i + 1 < len(words):
+                size_found = size_patterns.get(f"{word} {words[i+1]}")
             
             if size_found:
                 # Look for menu items nearby
@@ -263,13 +301,15 @@ class RestaurantAwareOrderParser:
                 
                 for search_words in search_ranges:
                     search_text = ' '.join(search_words).lower()
-                    for keyword in self.keyword_to_item.keys():
-                        if keyword in search_text:
-                            item = self.keyword_to_item[keyword]
-                            if hasattr(item, 'available_sizes') and size_found in item.available_sizes:
-                                sizes[keyword] = size_found
-                                break
-                    if keyword in sizes:
+                    size_matched = False
+                    for keyword_id in self.keyword_matcher.find(search_text):
+                        keyword = self.keyword_matcher.keywords[keyword_id]
+                        item = self.keyword_matcher.item_for(keyword_id)
+                        if item.supports_size(size_found):
+                            sizes[keyword] = size_found
+                            size_matched = True
+                            break
+                    if size_matched:
                         break
         
         return sizes
@@ -304,24 +344,22 @@ class RestaurantAwareOrderParser:
         """Find menu items from restaurant-specific list"""
         found_items = []
         
-        # Build temporary keyword index for this restaurant
-        restaurant_keywords = {}
-        for item in restaurant_items:
-            for keyword in item.keywords:
-                restaurant_keywords[keyword.lower()] = item
+        # Scan the text once for every keyword of this restaurant
+        matcher = self._get_keyword_matcher(restaurant_items)
         
         # Find exact matches first
-        for keyword, item in restaurant_keywords.items():
-            if keyword in text:
-                # Check for word boundaries for better precision
-                if re.search(r'\\b' + re.escape(keyword) + r'\\b', text):
-                    confidence = 0.95
-                else:
-                    confidence = 0.8
-                
-                # Avoid duplicates
-                if not any(existing_item == item for existing_item, _ in found_items):
-                    found_items.append((item, confidence))
+        for keyword_id in matcher.find(text):
+            keyword = matcher.keywords[keyword_id]
+            item = matcher.item_for(keyword_id)
+            # Check for word boundaries for better precision
+            if re.search(r'\\b' + re.escape(keyword) + r'\\b', text):
+                confidence = 0.95
+            else:
+                confidence = 0.8
+            
+            # Avoid duplicates
+            if not any(existing_item == item for existing_item, _ in found_items):
+                found_items.append((item, confidence))
         
         # Sort by confidence
         found_items.sort(key=lambda x: x[1], reverse=True)
@@ -362,32 +400,29 @@ class RestaurantAwareOrderParser:
             # Get quantity (default to 1)
             quantity = 1
             for keyword in menu_item.keywords:
-                if keyword in quantities:
-                    quantity = quantities[keyword]
+                if (found := quantities.get(keyword)) is not None:
+                    quantity = found
                     break
             
             # Get size
             size = None
             for keyword in menu_item.keywords:
-                if keyword in sizes:
-                    size = sizes[keyword]
+                if (found := sizes.get(keyword)) is not None:
+                    size = found
                     break
             
             # Calculate base price with size adjustment
             base_price = menu_item.base_price
-            if size and hasattr(menu_item, 'size_pricing'):
+            if size:
                 size_key = size.value if hasattr(size, 'value') else str(size)
-                size_adjustment = menu_item.size_pricing.get(size_key, Decimal('0.00'))
-                base_price += size_adjustment
+                base_price = menu_item.price(size_key)  # summed in integer cents
             
             # Filter modifications for this item
             valid_modifications = []
             for mod in modifications:
-                if mod.item.lower() in [m.lower() for m in menu_item.available_modifications]:
-                    if hasattr(menu_item, 'modification_pricing'):
-                        mod.price_change = menu_item.modification_pricing.get(
-                            mod.item.lower(), Decimal('0.00')
-                        )
+                price_change = menu_item.modification_price(mod.item)
+                if price_change is not None:
+                    mod.price_change = price_change
                     valid_modifications.append(mod)
             
             # Create order item
@@ -0,0 +1,33 @@
+"""
+Text Patterns
+Regex builders shared by the menu classifier and the order-menu keyword index
+"""
+
+import re
+from typing import Dict, Sequence
+
+
+def trie_pattern(words: Sequence[str]) -> str:
+    """Build a regex whose alternation is shaped like a trie of the given words.
+
+    Greedy optional groups make the pattern prefer the longest word at each
+    position, and the trie shape lets the stdlib engine branch on one
+    character at a time instead of retrying every keyword.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
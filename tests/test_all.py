@@ -1,16 +1,30 @@
 import unittest
 import sys
 import os
+import dataclasses
+import json
+import pickle
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+from decimal import Decimal
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append('.')
 
 from src.schema import MenuItem, MenuSchema
-from src.baseline import BaselineClassifier
+from src.baseline import BaselineClassifier, CategoryRule, _RuleMatcher
 from src.llm_enricher import MockLLMEnricher
 from src.data_generator import DataGenerator, DataCleaner
 from src.evaluation import MenuItemEvaluator
+from src import order_schema, menu_index
+from src.order_schema import OrderSchema, MenuItemTemplate, SizeType
+from src.menu_index import KeywordMatcher, KeywordScanner, TokenIndex, NameTrie
+from src.menu_analytics import MenuPriceTable
+from src.llm_order_parser import LLMOrderParser
+from src.baseline_order_parser import BaselineOrderParser
 
 
 class TestSchema(unittest.TestCase):
@@ -58,6 +72,15 @@ class TestBaselineClassifier(unittest.TestCase):
     def setUp(self):
         self.classifier = BaselineClassifier()
     
+    def test_import_does_not_load_order_menu(self):
+        """Test the classifier does not pull in the order-menu index or schema"""
+        code = "import sys, src.baseline; print('src.menu_index' in sys.modules, 'src.order_schema' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), 'False False')
+    
     def test_text_preprocessing(self):
         """Test text preprocessing"""
         text = "CHKN BURGER W/ CHEESE"
@@ -104,6 +127,24 @@ class TestBaselineClassifier(unittest.TestCase):
         self.assertEqual(result.cuisine, "Middle Eastern")
         self.assertIn("Spicy", result.attributes)
 
+    def test_overlapping_keywords(self):
+        """Keywords nested inside longer keywords are still counted"""
+        text = self.classifier.preprocess_text("Double Cheeseburger")
+        self.assertEqual(self.classifier.classify_category("Double Cheeseburger"), "Burger")
+        expected = sum(1 for rule in self.classifier.category_rules
+                       for keyword in rule.keywords if keyword in text)
+        self.assertGreaterEqual(expected, 2)  # "burger" and "cheeseburger"
+        self.assertAlmostEqual(self.classifier.get_classification_confidence("Double Cheeseburger")["category"],
+                               min(expected / 3.0, 1.0))
+
+    
+    def test_empty_rule_keyword(self):
+        """An empty rule keyword matches every text, as '' in text does, without stalling"""
+        matcher = _RuleMatcher([CategoryRule({'', 'burger', 'cheeseburger'}, 'Burger')])
+        self.assertEqual(matcher.keywords("double cheeseburger"), {'', 'burger', 'cheeseburger'})
+        self.assertEqual(matcher.keywords(""), {''})
+        self.assertEqual(matcher.count("fries"), 1)
+
 
 class TestDataGenerator(unittest.TestCase):
     """Test data generation functionality"""
@@ -224,6 +265,678 @@ class TestEvaluator(unittest.TestCase):
         self.assertEqual(validity_rate, 2/3)  # 2 out of 3 valid
 
 
+class TestMenuTemplates(unittest.TestCase):
+    """Test sample menu templates"""
+    
+    def setUp(self):
+        self.menu = OrderSchema.create_sample_menu()
+    
+    def test_templates_built_once(self):
+        """Test TEMPLATES is built lazily and shared by sample menus"""
+        self.assertIs(order_schema.TEMPLATES, order_schema.TEMPLATES)
+        self.assertIsInstance(order_schema.TEMPLATES, tuple)
+        self.assertEqual(self.menu, list(order_schema.TEMPLATES))
+    
+    def test_import_does_not_build_menu(self):
+        """Test importing the menu modules and parsers leaves the catalog unbuilt"""
+        code = (
+            "import src.menu_index, src.menu_analytics, src.baseline_order_parser, "
+            "src.restaurant_aware_parser; from src import order_schema; "
+            "print(order_schema._TEMPLATES_CACHE is None)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), 'True')
+    
+    def test_templates_use_slots(self):
+        """Test templates store fields in slots rather than a per-instance dict"""
+        template = self.menu[0]
+        self.assertFalse(hasattr(template, '__dict__'))
+        self.assertIn('keywords', MenuItemTemplate.__slots__)
+        with self.assertRaises(AttributeError):
+            template.unknown_field = 'value'
+    
+    def test_templates_read_only(self):
+        """Test shared sample templates refuse field edits, which would leave derived prices stale"""
+        template = next(t for t in OrderSchema.create_sample_menu() if t.keywords)
+        price, keywords = template.price(), template.keywords
+        for name, value in [('base_price', Decimal('99.99')), ('keywords', ('edited',)), ('base_price_cents', 1)]:
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                setattr(template, name, value)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            del template.name
+        self.assertEqual(template.price(), price)
+        self.assertIs(order_schema.TEMPLATES[template.template_id].keywords, keywords)
+        
+        edited = dataclasses.replace(template, base_price='99.99')
+        self.assertEqual(edited.price(), Decimal('99.99'))
+        self.assertEqual(edited.price_cents(), 9999)
+        self.assertEqual(template.price(), price)
+    
+    def test_templates_pickle(self):
+        """Test slotted templates survive a pickle round trip"""
+        template = self.menu[0]
+        restored = pickle.loads(pickle.dumps(template))
+        self.assertEqual(restored, template)
+        self.assertEqual(restored.price_cents('Large'), template.price_cents('Large'))
+    
+    def test_templates_pickle_to_worker_process(self):
+        """Test templates unpickled in another process price every modification the same"""
+        catalog = next(t for t in self.menu if t.available_sizes and t.modification_pricing)
+        avocado = MenuItemTemplate(name='Avocado Toast', category='Breakfast', base_price='5.00',
+                                   available_modifications=['add avocado', 'extra cheese'],
+                                   modification_pricing={'add avocado': Decimal('1.50'),
+                                                         'extra cheese': Decimal('0.50')})
+        lines = [(catalog, 'Large', list(catalog.modification_pricing)),
+                 (avocado, None, ['add avocado', 'extra cheese'])]
+        expected = [template.total_cents(size, mods, 2) for template, size, mods in lines]
+        self.assertEqual(expected[1], 1400)
+        code = (
+            "import pickle, sys; import src.order_schema; "
+            "lines = pickle.load(sys.stdin.buffer); "
+            "print([template.total_cents(size, mods, 2) for template, size, mods in lines])"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], input=pickle.dumps(lines),
+            cwd=Path(__file__).resolve().parent.parent, capture_output=True, check=True
+        )
+        self.assertEqual(result.stdout.decode().strip(), str(expected))
+    
+    def test_template_sequences_are_tuples(self):
+        """Test list arguments are stored as tuples of plain strings"""
+        built = MenuItemTemplate(name='Test', category='Burger', base_price='1.00',
+                                 available_sizes=[SizeType.SMALL], keywords=['big mac'])
+        self.assertEqual(built.available_sizes, ('Small',))
+        self.assertIsInstance(built.keywords, tuple)
+        self.assertIsInstance(self.menu[0].available_modifications, tuple)
+    
+    def test_templates_share_size_and_modification_tuples(self):
+        """Test equal size and modification lists resolve to one shared tuple"""
+        sizes = [SizeType.SMALL, SizeType.MEDIUM, SizeType.LARGE]
+        first = MenuItemTemplate(name='A', category='Beverage', base_price='1.00', available_sizes=sizes)
+        second = MenuItemTemplate(name='B', category='Beverage', base_price='2.00', available_sizes=list(sizes))
+        self.assertIs(first.available_sizes, second.available_sizes)
+        
+        catalog = next(t for t in self.menu if t.available_modifications)
+        copy = MenuItemTemplate(name='Copy', category=catalog.category, base_price=catalog.base_price,
+                                available_modifications=list(catalog.available_modifications))
+        self.assertIs(copy.available_modifications, catalog.available_modifications)
+    
+    def test_templates_share_pricing_mappings(self):
+        """Test equal pricing tables resolve to one shared read-only mapping"""
+        catalog = next(t for t in self.menu if t.available_sizes and t.size_pricing)
+        copy = MenuItemTemplate(
+            name='Copy', category=catalog.category, base_price=catalog.base_price,
+            available_sizes=list(catalog.available_sizes), size_pricing=dict(catalog.size_pricing),
+        )
+        self.assertIs(copy.size_pricing, catalog.size_pricing)
+    
+    def test_template_strings_interned(self):
+        """Test modification names, keywords and categories are interned"""
+        name, priced_name = ''.join(['extra ', 'pesto']), ''.join(['extra ', 'pesto'])
+        built = MenuItemTemplate(name='Test', category='Burger', base_price='1.00', available_modifications=[name],
+                                 modification_pricing={priced_name: Decimal('1.37')})
+        self.assertIs(next(iter(built.modification_pricing)), built.available_modifications[0])
+        self.assertIs(next(iter(built.modification_pricing_cents)), sys.intern('extra pesto'))
+        
+        keyword = ''.join(['big', ' ', 'mac'])
+        built = MenuItemTemplate(name='Test', category='Burger', base_price='1.00', keywords=[keyword])
+        self.assertIs(built.keywords[0], sys.intern('big mac'))
+        
+        category = ''.join(['Bur', 'ger'])
+        self.assertIs(MenuItemTemplate(name='C', category=category, base_price='1.00').category,
+                      sys.intern('Burger'))
+    
+    def test_templates_share_keyword_tuples(self):
+        """Test equal keyword lists resolve to one tuple and share derived lookups"""
+        by_keywords = {}
+        for template in self.menu:
+            self.assertIs(by_keywords.setdefault(template.keywords, template.keywords), template.keywords)
+        
+        catalog = next(t for t in self.menu if t.keywords)
+        twin = MenuItemTemplate(name='Twin', category='Burger', base_price='1.00', keywords=list(catalog.keywords))
+        self.assertIs(twin.keywords, catalog.keywords)
+        for template in (twin, catalog):
+            self.assertFalse(template.mentions('x'))
+            self.assertFalse(template.has_keyword('x'))
+        self.assertIs(twin._minimal_keywords, catalog._minimal_keywords)
+        self.assertIs(twin._keyword_set, catalog._keyword_set)
+    
+    def test_price_text_cache_bounded(self):
+        """Test arbitrary price texts do not grow the Decimal memo without limit"""
+        for cents in range(5000):
+            order_schema._c(f"{cents // 100}.{cents % 100:02d}9")
+        self.assertLessEqual(order_schema._D.cache_info().currsize, order_schema._D.cache_info().maxsize)
+        self.assertIs(order_schema._D('1.50'), order_schema._D('1.50'))
+    
+    def test_templates_share_prices(self):
+        """Test equal prices resolve to one shared Decimal across fields"""
+        first = MenuItemTemplate(name='A', category='Side', base_price=Decimal('1.50'),
+                                 modification_pricing={'extra salt': Decimal('0.75')})
+        second = MenuItemTemplate(name='B', category='Side', base_price=Decimal('1.50'),
+                                  size_pricing={'Large': Decimal('0.75')})
+        self.assertIs(first.base_price, second.base_price)
+        self.assertIs(first.modification_pricing['extra salt'], second.size_pricing['Large'])
+    
+    def test_compiled_catalog(self):
+        """Test the compiled catalog round-trips, and bad caches are rejected before any cache merge"""
+        raw = order_schema.MENU_CATALOG_PATH.read_bytes()
+        digest = order_schema._catalog_digest(raw)
+        tables = [order_schema._PRICING_CACHE, order_schema._TUPLE_CACHE, order_schema._MOD_SETS]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'menu.pkl'
+            self.assertIsNone(order_schema._load_compiled_catalog(digest, path))  # missing
+            
+            self.assertEqual(OrderSchema.compile_menu_catalog(path), len(self.menu))
+            self.assertEqual(os.listdir(tmp), ['menu.pkl'])
+            saved = [dict(table) for table in tables]
+            try:
+                self.assertEqual(order_schema._load_compiled_catalog(digest, path), list(self.menu))
+            finally:  # a successful load re-points the flyweight tables at the unpickled objects
+                for table, contents in zip(tables, saved):
+                    table.clear()
+                    table.update(contents)
+            self.assertIsNone(order_schema._load_compiled_catalog(b'stale', path))
+            compiled = path.read_bytes()
+            
+            sizes = [len(table) for table in tables]
+            foreign = {'x': 1}
+            bad_payloads = [
+                b'',
+                compiled[:len(compiled) // 2],
+                b'not a pickle',
+                pickle.dumps(foreign),
+                pickle.dumps((digest, ['not a template'], ({foreign['x']: 1}, {}, {}))),
+                pickle.dumps((digest, list(self.menu), ({('junk',): 1}, [], {}))),
+            ]
+            for payload in bad_payloads:
+                path.write_bytes(payload)
+                self.assertIsNone(order_schema._load_compiled_catalog(digest, path))
+            self.assertEqual([len(table) for table in tables], sizes)
+            self.assertNotIn(('junk',), order_schema._PRICING_CACHE)
+    
+    def test_compiled_catalog_prices_in_new_process(self):
+        """Test a compiled template prices its non-catalog modifications when loaded in another process"""
+        avocado = MenuItemTemplate(name='Avocado Toast', category='Breakfast', base_price='5.00',
+                                   available_modifications=['add avocado'],
+                                   modification_pricing={'add avocado': Decimal('1.50')})
+        self.assertEqual(avocado.total_cents(modifications=['add avocado']), 650)
+        digest = b'avocado'
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'menu.pkl'
+            order_schema._save_compiled_catalog(digest, [avocado], path)
+            code = (
+                "import sys; from pathlib import Path; from src import order_schema; "
+                "[template] = order_schema._load_compiled_catalog(b'avocado', Path(sys.argv[1])); "
+                "print(template.total_cents(modifications=['add avocado']))"
+            )
+            result = subprocess.run(
+                [sys.executable, '-c', code, str(path)], cwd=Path(__file__).resolve().parent.parent,
+                capture_output=True, text=True, check=True
+            )
+        self.assertEqual(result.stdout.strip(), '650')
+    
+    def test_loading_menu_writes_nothing(self):
+        """Test building the sample menu never writes the compiled catalog as a side effect"""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / 'menu.pkl'
+            original = order_schema.MENU_CACHE_PATH
+            order_schema.MENU_CACHE_PATH = cache_path
+            try:
+                self.assertEqual(order_schema._build_templates(), list(self.menu))
+            finally:
+                order_schema.MENU_CACHE_PATH = original
+            self.assertFalse(cache_path.exists())
+    
+    def test_menu_catalog_round_trip(self):
+        """Test saving and reloading the menu catalog preserves every template"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'menu.json'
+            OrderSchema.save_menu_catalog(self.menu, path)
+            with open(path, encoding='utf-8') as f:
+                reloaded = [order_schema._from_record(record) for record in json.load(f)]
+        
+        self.assertEqual(reloaded, self.menu)
+        self.assertEqual(OrderSchema.menu_fingerprint(reloaded), OrderSchema.menu_fingerprint(self.menu))
+        
+        custom = [
+            MenuItemTemplate(name='Large Only Shake', category='Beverage', base_price='4.00',
+                             available_sizes=[SizeType.LARGE], size_pricing={'Large': Decimal('0.80')}),
+            MenuItemTemplate(name='Odd Sizes Tea', category='Beverage', base_price='2.00',
+                             available_sizes=[SizeType.SMALL, SizeType.EXTRA_LARGE]),
+            MenuItemTemplate(name='Pricey Sizes Soda', category='Beverage', base_price='1.50',
+                             available_sizes=[SizeType.SMALL, SizeType.MEDIUM, SizeType.LARGE],
+                             size_pricing={'Small': Decimal('0.00'), 'Medium': Decimal('0.5'), 'Large': Decimal('1.00')}),
+            MenuItemTemplate(name='Avocado Burger', category='Burger', base_price='8.50',
+                             available_modifications=['extra cheese', 'add avocado', 'no onions', 'side salad'],
+                             modification_pricing={'extra cheese': Decimal('1.25'), 'add avocado': Decimal('1.50'),
+                                                   'no onions': Decimal('0.00')},
+                             keywords=['avocado burger', 'guac burger']),
+            MenuItemTemplate(name='Plain Burger', category='Burger', base_price='5.00',
+                             available_modifications=['extra cheese', 'no pickles'],
+                             modification_pricing={'extra cheese': Decimal('0.50'), 'no pickles': Decimal('0.00')}),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'menu.json'
+            OrderSchema.save_menu_catalog(custom, path)
+            with open(path, encoding='utf-8') as f:
+                records = json.load(f)
+        reloaded = [order_schema._from_record(record) for record in records]
+        self.assertEqual(reloaded, custom)
+        self.assertEqual([t.fingerprint for t in reloaded], [t.fingerprint for t in custom])
+        self.assertEqual(reloaded[0].available_sizes, ('Large',))
+        self.assertEqual(reloaded[3].modification_price('extra cheese'), Decimal('1.25'))
+        self.assertEqual(reloaded[3].modification_price('side salad'), Decimal('0.00'))
+        self.assertNotIn('mod_pricing', records[4])  # matches the catalog-wide prices
+    
+    def test_supports_size(self):
+        """Test the size bitmask agrees with the available size list"""
+        for item in self.menu:
+            for size in SizeType:
+                self.assertEqual(item.supports_size(size), size.value in item.available_sizes)
+                self.assertEqual(item.supports_size(size.value), size.value in item.available_sizes)
+    
+    def test_match_keyword(self):
+        """Test a template reports its longest keyword found in text"""
+        item = next(t for t in self.menu if t.name == "Big Mac Meal")
+        
+        self.assertEqual(item.match_keyword("one big mac meal please"), "mac meal")
+        self.assertEqual(item.match_keyword("just a big mac"), "big mac")
+        self.assertIsNone(item.match_keyword("a latte"))
+    
+    def test_mentions(self):
+        """Test probing minimal keywords agrees with probing every keyword"""
+        for text in ["one big mac meal please", "a footlong pro", "a latte", "xyz"]:
+            for item in self.menu:
+                self.assertEqual(item.mentions(text), any(kw in text for kw in item.keywords))
+    
+    def test_has_keyword(self):
+        """Test keyword membership ignores case and agrees with the keyword list"""
+        for item in self.menu[:50]:
+            for keyword in item.keywords:
+                self.assertTrue(item.has_keyword(keyword.upper()))
+        self.assertFalse(self.menu[0].has_keyword('not a keyword'))
+    
+    def test_offers_modification(self):
+        """Test modification lookups ignore case and agree with the modification list"""
+        item = next(t for t in self.menu if 'extra cheese' in t.available_modifications)
+        self.assertTrue(item.offers_modification('Extra Cheese'))
+        self.assertFalse(item.offers_modification('not a modification'))
+        
+        twin = next(t for t in self.menu if t is not item and t.available_modifications == item.available_modifications)
+        twin.offers_modification('extra cheese')
+        self.assertIs(twin._modification_names, item._modification_names)
+    
+    def test_templates_in_price_range(self):
+        """Test price range queries match a filter over every template"""
+        low, high = Decimal('5.00'), Decimal('7.50')
+        expected = sorted((t for t in self.menu if low <= t.base_price <= high), key=lambda t: t.base_price)
+        
+        self.assertEqual(list(order_schema.templates_in_price_range(low, high)), expected)
+        self.assertEqual(len(order_schema.SORTED_BY_PRICE), len(self.menu))
+    
+    def test_group_by_category(self):
+        """Test category buckets match a filter over every template"""
+        categories = OrderSchema.group_by_category(self.menu)
+        
+        self.assertIs(categories, order_schema.CATEGORIES)
+        for category, items in categories.items():
+            self.assertEqual(list(items), [t for t in self.menu if t.category == category])
+        self.assertEqual(order_schema.templates_in_category('No Such Category'), ())
+        with self.assertRaises(TypeError):
+            categories['Burger'] = ()
+    
+    def test_templates_with_size(self):
+        """Test the size index matches a scan of available sizes"""
+        for size in SizeType:
+            expected = tuple(t for t in self.menu if t.supports_size(size))
+            self.assertEqual(order_schema.templates_with_size(size), expected)
+            self.assertIs(order_schema.templates_with_size(size.value), order_schema.templates_with_size(size))
+        self.assertEqual(order_schema.templates_with_size('Not A Size'), ())
+    
+    def test_menu_price_table(self):
+        """Test vectorized per-category price stats match plain Python"""
+        stats = MenuPriceTable(self.menu).by_category()
+        
+        for category, items in OrderSchema.group_by_category(self.menu).items():
+            prices = [item.base_price for item in items]
+            self.assertEqual(stats[category]['count'], len(prices))
+            self.assertEqual(stats[category]['min'], min(prices))
+            self.assertEqual(stats[category]['max'], max(prices))
+    
+    def test_within_budget(self):
+        """Test the vectorized budget filter and packed names match the templates"""
+        table = MenuPriceTable(self.menu)
+        
+        for budget in [0, 299, 500, 1000]:
+            expected = [i for i, t in enumerate(self.menu) if t.base_price_cents <= budget]
+            self.assertEqual(table.within_budget(budget).tolist(), expected)
+            expected = [i for i in expected if self.menu[i].category == 'Burger']
+            self.assertEqual(table.within_budget(budget, 'Burger').tolist(), expected)
+        self.assertEqual(table.within_budget(1000, 'Not A Category').tolist(), [])
+        self.assertEqual(table.category_codes.itemsize, 1)
+        self.assertEqual(table.prices_cents.itemsize, 2)
+        self.assertEqual(table.within_budget(10 ** 9).size, len(self.menu))
+        self.assertEqual(table.within_budget(-1).size, 0)
+        self.assertEqual(table.in_category('Burger').tolist(), sorted(order_schema.category_ids('Burger')))
+        self.assertEqual(table.in_category('Not A Category').tolist(), [])
+        self.assertEqual([table.name(i) for i in range(len(self.menu))], [t.name for t in self.menu])
+    
+    def test_select(self):
+        """Test combined column filters match a scan over the templates"""
+        table = MenuPriceTable(self.menu)
+        for category, low, high, size in [('Burger', 300, 700, 'Large'), (None, None, 500, SizeType.SMALL),
+                                          ('Drink', 200, None, None), (None, 600, 400, None)]:
+            expected = [i for i, t in enumerate(self.menu)
+                        if (category is None or t.category == category)
+                        and (low is None or t.base_price_cents >= low)
+                        and (high is None or t.base_price_cents <= high)
+                        and (size is None or size in t.available_sizes)]
+            self.assertEqual(table.select(category, low, high, size).tolist(), expected)
+        self.assertEqual(table.select(size='Not A Size').size, 0)
+        self.assertEqual(table.select(min_cents=-10 ** 9, max_cents=10 ** 9).size, len(self.menu))
+    
+    def test_price_lines(self):
+        """Test batch line pricing matches per-template price_cents"""
+        table = MenuPriceTable(self.menu)
+        ids = list(range(0, len(self.menu), 7))
+        sizes = [['Large', None, 'Medium', 'Not A Size'][i % 4] for i in range(len(ids))]
+        masks = [order_schema.modification_mask(['extra cheese', 'extra sauce'][:i % 3]) for i in range(len(ids))]
+        
+        expected = [self.menu[i].price_cents(size, mask) for i, size, mask in zip(ids, sizes, masks)]
+        self.assertEqual(table.price_lines(ids, masks, sizes).tolist(), expected)
+        self.assertEqual(table.price_lines(ids).tolist(), [self.menu[i].base_price_cents for i in ids])
+        
+        quantities = [i % 3 + 1 for i in range(len(ids))]
+        self.assertEqual(table.order_total(ids, quantities, masks, sizes),
+                         sum(p * q for p, q in zip(expected, quantities)))
+        self.assertEqual(table.order_total(ids), sum(self.menu[i].base_price_cents for i in ids))
+        self.assertEqual(table.order_total([]), 0)
+    
+    def test_price_lines_wide_masks(self):
+        """Test batch line pricing past 63 modification bits (run apart: mask bits are process-wide)"""
+        code = (
+            "from decimal import Decimal; from src import order_schema; "
+            "from src.order_schema import MenuItemTemplate; from src.menu_analytics import MenuPriceTable; "
+            "mods = [f'wide mod {i}' for i in range(80)]; "
+            "wide = MenuItemTemplate(name='Wide', category='Burger', base_price='5.00', available_modifications=mods, "
+            "modification_pricing={mod: Decimal(i + 1).scaleb(-2) for i, mod in enumerate(mods)}); "
+            "menu = [order_schema.TEMPLATES[0], wide]; "
+            "masks = [order_schema.modification_mask(mods[i::7]) for i in range(7)]; "
+            "table = MenuPriceTable(menu); "
+            "late = MenuItemTemplate(name='Late', category='Side', base_price='1.00', "
+            "modification_pricing={'late mod': Decimal('9.99')}); "
+            "masks.append(order_schema.modification_mask(mods[-3:] + ['late mod'])); "
+            "ids = [1] * len(masks) + [0]; masks.append(0); "
+            "print(len(order_schema._MOD_BITS) > 64, "
+            "table.price_lines(ids, masks).tolist() == [menu[i].price_cents(None, m) for i, m in zip(ids, masks)])"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), 'True True')
+    
+    def test_price_line(self):
+        """Test line pricing adds size and modification prices in cents"""
+        item = next(t for t in self.menu if t.available_sizes and 'extra cheese' in t.available_modifications)
+        mods = ('extra cheese', 'extra sauce', 'not a modification')
+        expected = item.price_cents('Large') + sum(item.modification_pricing_cents.get(mod, 0) for mod in mods)
+        
+        mask = order_schema.modification_mask(mods)
+        self.assertEqual(mask, order_schema.modification_mask(reversed(mods)))
+        self.assertEqual(order_schema.price_line(item.template_id, 'Large', mask), expected)
+        self.assertEqual(order_schema.price_line(item.template_id), item.base_price_cents)
+        
+        twin = next(t for t in self.menu if t is not item and t.modification_pricing is item.modification_pricing)
+        self.assertEqual(twin.price_cents(None, mask), twin.base_price_cents + expected - item.price_cents('Large'))
+        self.assertIs(twin._mod_totals, item._mod_totals)
+        
+        # Past six priced modifications the combinations are summed per bit instead
+        mods = ['extra cheese', 'extra crispy', 'extra foam', 'extra hot', 'extra lettuce', 'extra mayo', 'extra salt']
+        wide = MenuItemTemplate(name='Wide', category='Burger', base_price='5.00', available_modifications=mods,
+                                modification_pricing={mod: Decimal('0.25') for mod in mods})
+        self.assertEqual(wide.price_cents(None, order_schema.modification_mask(mods + ['decaf'])), 500 + 7 * 25)
+        self.assertIsNone(wide._mod_totals[1])
+
+    def test_modification_price(self):
+        """Test the one-lookup modification price agrees with availability plus pricing"""
+        names = ['Extra Cheese', 'no pickles', 'bacon', 'decaf', 'unknown']
+        for template in self.menu:
+            for name in names:
+                expected = (template.modification_pricing.get(name.lower(), Decimal('0.00'))
+                            if template.offers_modification(name) else None)
+                self.assertEqual(template.modification_price(name), expected)
+        profiles = [t for t in self.menu if t.available_modifications]
+        twins = [t for t in profiles if t.available_modifications is profiles[0].available_modifications]
+        for template in (twins[0], twins[-1]):
+            self.assertIsNone(template.modification_price('x'))
+        self.assertIs(twins[0]._modification_prices, twins[-1]._modification_prices)
+
+    def test_total_cents(self):
+        """Test integer line totals agree with the Decimal OrderItem total"""
+        item = next(t for t in self.menu if t.available_sizes and 'extra cheese' in t.available_modifications)
+        mods = ['extra cheese', 'extra sauce']
+        line = order_schema.OrderItem(
+            name=item.name, quantity=3, size='Large', base_price=item.price('Large'),
+            modifications=[
+                order_schema.Modification(type='add', item=mod, price_change=item.modification_pricing.get(mod, Decimal('0.00')))
+                for mod in mods
+            ],
+        )
+        self.assertEqual(Decimal(item.total_cents('Large', mods, 3)).scaleb(-2), line.total_price)
+        
+        plain = order_schema.OrderItem(name=item.name, quantity=2, base_price=item.price())
+        order = order_schema.Order(items=[line, plain])
+        self.assertEqual(order.subtotal, line.total_price + plain.total_price)
+        self.assertEqual(str(order_schema.Order().subtotal), '0.00')
+    
+    def test_order_subtotal_keeps_sub_cent_prices(self):
+        """Test the subtotal is the exact sum of line totals, sub-cent prices included"""
+        lines = [
+            order_schema.OrderItem(name='Wings', quantity=3, base_price=Decimal('0.335')),
+            order_schema.OrderItem(name='Shake', base_price=Decimal('2.10'), modifications=[
+                order_schema.Modification(type='add', item='malt', price_change=Decimal('0.125'))]),
+        ]
+        self.assertEqual(lines[0].total_price, Decimal('1.005'))
+        order = order_schema.Order(items=lines)
+        self.assertEqual(order.subtotal, Decimal('3.230'))
+        self.assertEqual(order.total_amount, Decimal('3.230') * Decimal('1.08'))
+        # Unvalidated items (model_construct) can carry NaN; it propagates rather than raising
+        special = order_schema.OrderItem.model_construct(name='Special', base_price=Decimal('NaN'))
+        self.assertTrue(order_schema.Order(items=[special]).subtotal.is_nan())
+
+    def test_llm_menu_context_shared(self):
+        """Test the LLM menu listing is rendered once for the sample menu"""
+        first, second = LLMOrderParser(), LLMOrderParser(self.menu)
+        self.assertIs(first.menu_context, second.menu_context)
+        self.assertEqual(LLMOrderParser(self.menu[:3]).menu_context.count('\n'), 3)
+    
+    def test_parser_indexes_shared(self):
+        """Test parsers over the sample menu reuse its indexes but own their copies"""
+        first, second = BaselineOrderParser(), BaselineOrderParser(self.menu)
+        self.assertEqual(first.restaurant_to_items, second.restaurant_to_items)
+        self.assertIsNot(first.restaurant_to_items["McDonald's"], second.restaurant_to_items["McDonald's"])
+        self.assertIs(first.keyword_to_item, second.keyword_to_item)
+        
+        subset = BaselineOrderParser(self.menu[:20])
+        self.assertEqual(sum(map(len, subset.restaurant_to_items.values())), 20)
+        self.assertEqual(list(subset.name_to_item), list(dict.fromkeys(item.name.lower() for item in self.menu[:20])))
+    
+    def test_brand_menus(self):
+        """Test per-brand menus are views of TEMPLATES built once per brand"""
+        kfc = order_schema.MENUS.kfc
+        self.assertTrue(kfc)
+        self.assertIs(order_schema.MENUS['KFC'], kfc)
+        self.assertTrue(all(item.template_id is not None for item in kfc))
+        self.assertIn('mcdonalds', order_schema.MENUS.brands())
+        with self.assertRaises(KeyError):
+            order_schema.MENUS['Not A Brand']
+
+    def test_menu_fingerprint(self):
+        """Test menu fingerprint is stable and tracks field changes"""
+        fingerprint = OrderSchema.menu_fingerprint(self.menu)
+        self.assertEqual(fingerprint, OrderSchema.menu_fingerprint())
+        
+        renamed = dataclasses.replace(self.menu[-1], name='Renamed Item')
+        changed = self.menu[:-1] + [renamed]
+        self.assertNotEqual(fingerprint, OrderSchema.menu_fingerprint(changed))
+    
+    def test_keyword_matcher(self):
+        """Test compiled keyword matching finds every contained keyword"""
+        matcher = KeywordMatcher(self.menu)
+        
+        for text in ["big mac no pickles with large fries", "a latte and a cheesburger", "nothing here"]:
+            expected = [kw for kw in matcher.keywords if kw in text]
+            self.assertEqual(matcher.find_keywords(text), expected)
+        
+        self.assertEqual(matcher.best_match("five guys bacon cheeseburger please").name, "Little Bacon Cheeseburger")
+        self.assertIsNone(matcher.best_match("xyz"))
+    
+    def test_shared_keyword_matcher(self):
+        """Test the sample menu shares one compiled matcher and find_items uses it"""
+        shared = menu_index.keyword_matcher_for(self.menu)
+        self.assertIs(shared, menu_index.KEYWORD_MATCHER)
+        self.assertIsNot(menu_index.keyword_matcher_for(self.menu[:10]), shared)
+        
+        text = "Big Mac no pickles with large fries"
+        self.assertEqual(menu_index.find_items(text), shared.template_ids(text.lower()))
+        
+        burgers = [i for i in menu_index.find_items(text) if self.menu[i].category == 'Burger']
+        self.assertTrue(burgers)
+        self.assertEqual(menu_index.find_items(text, 'Burger'), burgers)
+        self.assertEqual(menu_index.find_items(text, 'Not A Category'), [])
+
+    def test_lookup_keyword(self):
+        """Test exact keyword and name lookups match a scan over every template"""
+        for keyword in ["big mac", "Big Mac Meal", "cheesburger", "latte", "no such keyword"]:
+            expected = [
+                i for i, t in enumerate(self.menu)
+                if keyword.lower() in [kw.lower() for kw in t.keywords] or t.name.lower() == keyword.lower()
+            ]
+            self.assertEqual(menu_index.lookup_keyword(keyword), expected)
+    
+    def test_partial_matches(self):
+        """Test fuzzy keyword matches agree with a scan over every keyword"""
+        matcher = menu_index.KEYWORD_MATCHER
+
+        for words in [["burgers"], ["chick", "nuggetz"], ["cheeseburgers", "mcflurry"], ["xyzzy", "fry"]]:
+            for min_length, ratio in [(4, 0.6), (3, 0.3), (6, 0.9)]:
+                expected = [
+                    keyword_id for keyword_id, keyword in enumerate(matcher.keywords)
+                    if any(len(word) >= min_length and len(keyword) >= min_length and (
+                        (word in keyword and len(word) >= len(keyword) * ratio) or
+                        (keyword in word and len(keyword) >= len(word) * ratio)) for word in words)
+                ]
+                self.assertEqual(matcher.partial_matches(words, min_length, ratio), expected)
+
+    def test_keywords_containing(self):
+        """Test keyword substring search agrees with a scan over every keyword"""
+        matcher = menu_index.KEYWORD_MATCHER
+        for fragment in ["chicken", "Burg", "a", "xyzzy", ""]:
+            expected = [keyword_id for keyword_id, keyword in enumerate(matcher.keywords) if fragment.lower() in keyword]
+            self.assertEqual(matcher.keywords_containing(fragment), expected)
+        self.assertEqual(matcher.keywords_containing(""), list(range(len(matcher.keywords))))
+        # Newlines separate keywords in the packed columns and never occur in one
+        same_length = [keyword for keyword in matcher.keywords if len(keyword) == len(matcher.keywords[0])]
+        spanning = same_length[0][-2:] + "\n" + same_length[1][:2]
+        for fragment in [spanning, "\n", "a\n"]:
+            self.assertEqual(matcher.keywords_containing(fragment), [])
+
+    def test_find_whole_words(self):
+        """Test whole-word keyword matches agree with a word-boundary regex per keyword"""
+        matcher = menu_index.KEYWORD_MATCHER
+        for text in ["two big macs and a big mac", "mcchicken_sandwich", "large fries, no salt", "cheeseburger"]:
+            expected = [keyword_id for keyword_id, keyword in enumerate(matcher.keywords)
+                        if re.search(r'\b' + re.escape(keyword) + r'\b', text)]
+            self.assertEqual(matcher.find_whole_words(text), expected)
+            for start, keyword_id in matcher.occurrences(text):
+                self.assertTrue(text.startswith(matcher.keywords[keyword_id], start))
+
+    def test_keyword_scanner(self):
+        """Test a plain keyword scanner finds overlapping and duplicate keywords"""
+        scanner = KeywordScanner(["taco", "taco bell", "bell", "taco"])
+        self.assertEqual(scanner.keywords, ["taco", "taco bell", "bell"])
+        self.assertEqual(scanner.find("a taco bell order"), [0, 1, 2])
+        self.assertEqual(scanner.find("tacos"), [0])
+        self.assertEqual(scanner.find_whole_words("tacos at the bell"), [2])
+        self.assertIsNone(scanner.keyword_id("burrito"))
+        self.assertIs(menu_index.keyword_scanner_for(["taco", "bell"]), menu_index.keyword_scanner_for(("taco", "bell")))
+    
+    def test_keyword_scanner_empty_keyword(self):
+        """Test an empty keyword occurs everywhere, like '' in text, without stalling the scan"""
+        keywords = ["", "burger", "cheeseburger", "cheese"]
+        scanner = KeywordScanner(keywords)
+        for text in ["a cheeseburger", "", "!!", "burger burger"]:
+            expected = [keyword_id for keyword_id, keyword in enumerate(keywords) if keyword in text]
+            self.assertEqual(scanner.find(text), expected)
+            occurrences = sorted(scanner.occurrences(text))
+            self.assertEqual(occurrences, sorted((start, keyword_id) for keyword_id, keyword in enumerate(keywords)
+                                                 for start in range(len(text) + 1) if text.startswith(keyword, start)))
+            expected = [keyword_id for keyword_id, keyword in enumerate(keywords)
+                        if re.search(r'\b' + re.escape(keyword) + r'\b', text)]
+            self.assertEqual(scanner.find_whole_words(text), expected)
+        self.assertEqual(KeywordScanner([""]).find("anything"), [0])
+        self.assertEqual(KeywordScanner([]).find("anything"), [])
+
+    def test_keyword_items(self):
+        """Test the shared keyword -> template map matches a per-keyword dict build"""
+        expected = {}
+        for item in self.menu:
+            for keyword in item.keywords:
+                expected[keyword.lower()] = item
+        items = KeywordMatcher(self.menu).keyword_items()
+        self.assertEqual(dict(items), expected)
+        self.assertEqual(list(items), list(expected))
+        with self.assertRaises(TypeError):
+            items['big mac'] = self.menu[0]
+
+    def test_keywords_with_prefix(self):
+        """Test keyword prefix search agrees with a scan over every keyword"""
+        matcher = menu_index.KEYWORD_MATCHER
+        for prefix in ["chicken", "Big", "b", "zzz", ""]:
+            expected = [keyword_id for keyword_id, keyword in enumerate(matcher.keywords)
+                        if keyword.startswith(prefix.lower())]
+            self.assertEqual(matcher.keywords_with_prefix(prefix), expected)
+
+    def test_token_index(self):
+        """Test token lookups match a scan over every template"""
+        index = TokenIndex(self.menu)
+        
+        for query in ["big mac", "chicken sandwich", "large latte"]:
+            expected = [
+                item for item in self.menu
+                if all(any(token in kw.lower().split() for kw in item.keywords) for token in query.split())
+            ]
+            self.assertEqual(index.lookup(query), expected)
+    
+    def test_name_trie(self):
+        """Test name lookups tolerate a single typo"""
+        trie = NameTrie(self.menu)
+        
+        self.assertEqual(trie.search("Big Mac Meal"), ("big mac meal", 0))
+        self.assertEqual(trie.search("big mak meal"), ("big mac meal", 1))
+        self.assertEqual(trie.lookup("big mak meal").name, "Big Mac Meal")
+        self.assertIsNone(trie.lookup("pizza party"))
+        
+        big_mac_meal = next(i for i, t in enumerate(self.menu) if t.name == "Big Mac Meal")
+        self.assertIn((big_mac_meal, 2), trie.within("big mak mel", 2))
+        self.assertNotIn(big_mac_meal, [i for i, _ in trie.within("big mak mel", 1)])
+        self.assertEqual(menu_index.fuzzy_find("big mac meal", 0), [big_mac_meal])
+    
+    def test_name_prefix_and_infix(self):
+        """Test autocomplete and substring name search match a scan over every name"""
+        names = [t.name.lower() for t in self.menu]
+        
+        for query in ["Big", "chicken s", "mc", "zzz", ""]:
+            self.assertEqual(menu_index.find_by_prefix(query),
+                             [i for i, name in enumerate(names) if name.startswith(query.lower())])
+            self.assertEqual(menu_index.find_containing(query),
+                             [i for i, name in enumerate(names) if query.lower() in name])
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     